@@ -3,6 +3,8 @@
 
 """Background task coordinator."""
 
+import logging
+import queue
 import threading
 import time
 from typing import Callable
@@ -23,8 +25,19 @@ class BackgroundCoordinator:
         self.state_manager = state_manager
         self.event_bus = event_bus
         self.manager_service = manager_service
+        # One long-lived ShardManager: its TTL cache only pays off if the
+        # periodic refresh and job worker share the same instance
+        self._shard_manager = ShardManager()
         self._running = False
         self._background_thread = None
+        # Single long-lived worker consuming queued jobs; serializes the
+        # is_working flag instead of racing one thread per action
+        self._job_queue: queue.Queue = queue.Queue()
+        self._job_thread = None
+        # Chat poll backoff: tightens while messages are flowing, relaxes
+        # toward the ceiling when the server is quiet
+        self._chat_poll_interval = 5.0
+        self._chat_log_size = None
 
     def start(self) -> None:
         """Start background coordinator."""
@@ -36,31 +49,50 @@ class BackgroundCoordinator:
             target=self._background_loop, daemon=True
         )
         self._background_thread.start()
+        self._job_thread = threading.Thread(target=self._job_loop, daemon=True)
+        self._job_thread.start()
 
     def stop(self) -> None:
         """Stop background coordinator."""
         self._running = False
+        self._job_queue.put(None)  # Wake the job worker so it can exit
         if self._background_thread:
             self._background_thread.join(timeout=1.0)
+        if self._job_thread:
+            self._job_thread.join(timeout=1.0)
 
     def run_in_background(self, func: Callable, *args, **kwargs) -> None:
-        """Run a function in background thread."""
+        """Queue a function for the background job worker."""
+        self._job_queue.put((func, args, kwargs))
 
-        def worker():
+    def _job_loop(self) -> None:
+        """Consume queued jobs one at a time on the worker thread."""
+        while True:
+            job = self._job_queue.get()
+            if job is None:
+                break
+
+            func, args, kwargs = job
             self.event_bus.publish(Event(EventType.BACKGROUND_TASK_START))
             self.state_manager.set_working(True)
             try:
                 func(*args, **kwargs)
-                # Refresh shards after task completes
-                shard_manager = ShardManager()
-                new_shards = shard_manager.get_shards()
+                # Refresh shards after task completes; jobs that touched
+                # systemd already invalidated the cache through their own
+                # manager, so force a fresh query here
+                self._shard_manager.invalidate_cache()
+                new_shards = self._shard_manager.get_shards()
                 self.state_manager.update_shards(new_shards)
                 self.event_bus.publish(Event(EventType.SHARD_REFRESH, new_shards))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Keep the worker alive if a job fails
+                logging.getLogger(__name__).warning(
+                    "Background job %s raised exception: %s", func, e
+                )
             finally:
                 self.state_manager.set_working(False)
                 self.event_bus.publish(Event(EventType.BACKGROUND_TASK_END))
-
-        threading.Thread(target=worker, daemon=True).start()
+                self._job_queue.task_done()
 
     def _background_loop(self) -> None:
         """Main background loop for periodic updates."""
@@ -74,8 +106,7 @@ class BackgroundCoordinator:
                     not state.ui_state.log_viewer_active
                     and not state.ui_state.mods_viewer_active
                 ):
-                    shard_manager = ShardManager()
-                    new_shards = shard_manager.get_shards()
+                    new_shards = self._shard_manager.get_shards()
                     self.state_manager.update_shards(new_shards)
 
                     # Check master offline status
@@ -118,33 +149,33 @@ class BackgroundCoordinator:
                     StatusManager.request_status_update()
                 self.state_manager.update_timing(last_status_poll_time=current_time)
 
-            # Chat logs refresh (every 5 seconds)
-            if current_time - state.last_chat_read_time > 5.0:
-                chat_logs = ChatManager.get_chat_logs(50)
-                if chat_logs:
-                    # Filter out duplicate messages using the seen_messages set
-                    new_messages = []
-                    for message in chat_logs:
-                        if message not in state.ui_state.seen_chat_messages:
-                            new_messages.append(message)
-                            state.ui_state.seen_chat_messages.add(message)
-
-                    # Update the chat logs with new messages only
+            # Chat logs refresh (adaptive interval: halve on activity,
+            # double on empty polls, bounded 1s..60s)
+            if current_time - state.last_chat_read_time > self._chat_poll_interval:
+                new_messages = []
+                # One stat decides whether there is anything to read at
+                # all; unchanged size means an idle tick
+                log_size = ChatManager.get_chat_log_size()
+                if log_size != self._chat_log_size:
+                    self._chat_log_size = log_size
+                    # The tail reader tracks a byte offset, so each line
+                    # arrives exactly once and no content dedup is needed;
+                    # the deque's maxlen evicts the oldest entries
+                    new_messages = ChatManager.read_new_chat_lines()
                     if new_messages:
                         state.ui_state.cached_chat_logs.extend(new_messages)
-                        # Limit the total number of messages to prevent memory issues
-                        if len(state.ui_state.cached_chat_logs) > 200:
-                            # Remove oldest messages and their IDs from seen_messages
-                            oldest_messages = state.ui_state.cached_chat_logs[:-150]
-                            for msg in oldest_messages:
-                                state.ui_state.seen_chat_messages.discard(msg)
-                            state.ui_state.cached_chat_logs = (
-                                state.ui_state.cached_chat_logs[-150:]
-                            )
-
                         self.event_bus.publish(
                             Event(EventType.CHAT_MESSAGE, new_messages)
                         )
+
+                if new_messages:
+                    self._chat_poll_interval = max(
+                        1.0, self._chat_poll_interval * 0.5
+                    )
+                else:
+                    self._chat_poll_interval = min(
+                        60.0, self._chat_poll_interval * 2.0
+                    )
                 self.state_manager.update_timing(last_chat_read_time=current_time)
 
             time.sleep(0.1)
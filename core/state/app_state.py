@@ -3,9 +3,9 @@
 
 """Application state management."""
 
-import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set
+from typing import Any, Deque, Dict, List
 
 from utils.config import Shard
 
@@ -35,8 +35,9 @@ class UIState:
     log_content: List[str] = field(default_factory=list)
     log_scroll_pos: int = 0
     mods: List[Dict[str, Any]] = field(default_factory=list)
-    cached_chat_logs: List[str] = field(default_factory=list)
-    seen_chat_messages: Set[str] = field(default_factory=set)
+    # Ring buffer: old messages fall off automatically, so nothing ever
+    # reallocates or slices the history to trim it
+    cached_chat_logs: Deque[str] = field(default_factory=lambda: deque(maxlen=200))
 
 
 @dataclass
@@ -48,7 +49,6 @@ class AppState:
     ui_state: UIState = field(default_factory=UIState)
     is_working: bool = False
     need_redraw: bool = True
-    shards_lock: threading.Lock = field(default_factory=threading.Lock)
 
     # Timing state
     last_refresh_time: float = 0.0
@@ -73,14 +73,20 @@ class StateManager:
         return self._state
 
     def update_shards(self, shards: List[Shard]) -> None:
-        """Update shards list thread-safely."""
-        with self._state.shards_lock:
-            self._state.shards = shards
+        """Publish a new shards snapshot.
+
+        The refresher threads replace the whole list in one reference
+        assignment (atomic under the GIL), so readers never need a lock.
+        """
+        self._state.shards = list(shards)
 
     def get_shards_copy(self) -> List[Shard]:
-        """Get a thread-safe copy of shards."""
-        with self._state.shards_lock:
-            return list(self._state.shards)
+        """Get the current shards snapshot.
+
+        The returned list is never mutated in place — refreshes publish a
+        new list — so the draw thread can read it lock-free.
+        """
+        return self._state.shards
 
     def update_server_status(self, status: Dict[str, Any]) -> None:
         """Update server status."""
@@ -4,7 +4,9 @@
 """Chat manager for handling game chat functionality."""
 
 import collections
-from typing import List
+import errno
+import os
+from typing import List, Optional
 
 from utils.config import HOME_DIR, config_manager, get_game_config
 
@@ -12,16 +14,55 @@ from utils.config import HOME_DIR, config_manager, get_game_config
 class ChatManager:
     """Manages game chat functionality."""
 
+    # Incremental tail state for the append-only chat log: after the first
+    # read, each poll seeks to the stored byte offset and reads only what
+    # was appended, so an idle poll costs a single stat. Rotation or
+    # truncation (inode change, size shrink) resets the state.
+    _tail_inode = None
+    _tail_offset = 0
+    _tail_partial = b""
+    _tail_lines: collections.deque = collections.deque(maxlen=500)
+    # Lines appended since the last read_new_chat_lines call; lets the
+    # poller consume deltas without content-based deduplication
+    _pending_new: collections.deque = collections.deque(maxlen=500)
+    # Open FIFO write descriptors per shard; keeping them avoids an
+    # open/close (previously a whole shell subprocess) per command
+    _fifo_handles: dict = {}
+
     @staticmethod
-    def get_chat_logs(lines: int = 50) -> List[str]:
-        """Gets the latest chat messages from the game chat log."""
+    def _chat_log_path():
+        """Path of the Master shard's chat log for the active cluster."""
         config = get_game_config()
         cluster_name = config.get("CLUSTER_NAME", "MyDediServer")
         dst_dir = config.get("DONTSTARVE_DIR")
+        return dst_dir / cluster_name / "Master" / "server_chat_log.txt"
+
+    @classmethod
+    def get_chat_log_size(cls) -> int:
+        """Byte size of the chat log, or -1 when it is missing.
+
+        One stat; pollers compare this against the last seen size to
+        skip reading and deduplicating entirely on idle ticks.
+        """
+        try:
+            return os.stat(cls._chat_log_path()).st_size
+        except OSError:
+            return -1
 
-        chat_log_path = dst_dir / cluster_name / "Master" / "server_chat_log.txt"
+    @classmethod
+    def _refresh_tail(cls) -> Optional[List[str]]:
+        """Pull newly appended lines into the tail buffers.
 
-        if not chat_log_path.exists():
+        Returns a diagnostic line list when the log cannot be read, or
+        None on success.
+        """
+        chat_log_path = cls._chat_log_path()
+
+        try:
+            st = os.stat(chat_log_path)
+        except OSError:
+            config = get_game_config()
+            cluster_name = config.get("CLUSTER_NAME", "MyDediServer")
             available_clusters = config_manager.get_available_clusters()
             return [
                 f"Chat log file not found at {chat_log_path}.",
@@ -30,40 +71,97 @@ class ChatManager:
                 "Make sure the server is running and the cluster directory exists.",
             ]
 
-        try:
-            # Read the entire file and get all lines
-            with chat_log_path.open("r", encoding="utf-8") as f:
-                all_lines = [line.strip() for line in f if line.strip()]
-
-            if not all_lines:
-                return []
-
-            # Filter out status command responses and other non-chat messages
-            # Only keep actual chat messages and important announcements
-            filtered_lines = []
-            for line in all_lines:
-                # Keep chat messages
+        fresh_start = st.st_ino != cls._tail_inode or st.st_size < cls._tail_offset
+        if fresh_start:
+            # New, rotated or truncated file: start over from the top
+            cls._tail_inode = st.st_ino
+            cls._tail_offset = 0
+            cls._tail_partial = b""
+            cls._tail_lines.clear()
+            cls._pending_new.clear()
+
+        if st.st_size > cls._tail_offset:
+            start = cls._tail_offset
+            skipped_history = False
+            if start == 0 and st.st_size > 131072:
+                # Fresh tail on a big log: anything beyond the deque's
+                # capacity would be evicted anyway, so jump to the last
+                # 128 KiB instead of reading the file from byte 0
+                start = st.st_size - 131072
+                skipped_history = True
+            try:
+                with chat_log_path.open("rb") as f:
+                    f.seek(start)
+                    data = f.read()
+                    cls._tail_offset = f.tell()
+            except OSError as e:
+                return [f"Error reading chat log: {e}"]
+
+            chunks = (cls._tail_partial + data).split(b"\n")
+            # Bytes after the last newline belong to a line still being
+            # written; hold them for the next read
+            cls._tail_partial = chunks.pop()
+            if skipped_history and chunks:
+                # The jump rarely lands on a line boundary; the first
+                # chunk is a partial line
+                del chunks[0]
+
+            for chunk in chunks:
+                line = chunk.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+                # Keep chat messages and announcements; drop status
+                # command responses that would cause duplicates
                 if (
                     "[Say]" in line
                     or "[Join Announcement]" in line
                     or "[Leave Announcement]" in line
                 ):
-                    filtered_lines.append(line)
-                # Filter out status command responses that might cause duplicates
+                    cls._tail_lines.append(line)
+                    cls._pending_new.append(line)
                 elif "c_listallplayers" in line or "c_dumpseasons" in line:
                     continue
-                # Keep other potentially important messages
                 else:
-                    filtered_lines.append(line)
+                    cls._tail_lines.append(line)
+                    cls._pending_new.append(line)
 
-            # Return only the most recent messages
-            if filtered_lines:
-                return filtered_lines[-min(lines, len(filtered_lines)) :]
-            else:
-                return []
+            if fresh_start:
+                # A fresh tail rereads history; deliver at most the 50
+                # lines the pre-offset reader surfaced so a restart does
+                # not flood subscribers with old messages as "new"
+                while len(cls._pending_new) > 50:
+                    cls._pending_new.popleft()
 
-        except (OSError, UnicodeDecodeError) as e:
-            return [f"Error reading chat log: {e}"]
+        return None
+
+    @classmethod
+    def get_chat_logs(cls, lines: int = 50) -> List[str]:
+        """Gets the latest chat messages from the game chat log."""
+        error = cls._refresh_tail()
+        if error is not None:
+            return error
+
+        if not cls._tail_lines:
+            return []
+
+        # Return only the most recent messages
+        tail = list(cls._tail_lines)
+        return tail[-min(lines, len(tail)):]
+
+    @classmethod
+    def read_new_chat_lines(cls) -> List[str]:
+        """Return only the lines appended since the previous call.
+
+        Byte-offset based: each line is delivered exactly once, so
+        callers need no content-based deduplication. Rotation resets the
+        offset and redelivers from the top of the new file.
+        """
+        if cls._refresh_tail() is not None:
+            return []
+
+        new_lines = list(cls._pending_new)
+        cls._pending_new.clear()
+        return new_lines
 
     @staticmethod
     def send_chat_message(shard_name: str, message: str) -> tuple[bool, str]:
@@ -83,33 +181,50 @@ class ChatManager:
         command = f'TheNet:SystemMessage("{message}")'
         return ChatManager.send_command(shard_name, command)
 
-    @staticmethod
-    def send_command(shard_name: str, command: str) -> tuple[bool, str]:
+    @classmethod
+    def _close_fifo(cls, shard_name: str) -> None:
+        """Close and forget the cached FIFO handle for a shard."""
+        fd = cls._fifo_handles.pop(shard_name, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    @classmethod
+    def close_fifo_handles(cls) -> None:
+        """Close every cached FIFO handle; called on shutdown."""
+        for shard_name in list(cls._fifo_handles):
+            cls._close_fifo(shard_name)
+
+    @classmethod
+    def send_command(cls, shard_name: str, command: str) -> tuple[bool, str]:
         """Sends a command to the specified shard's console."""
         # Allow commands to all shards (not just Master) for status polling
 
         fifo_path = HOME_DIR / ".cache" / "dontstarve" / f"dst-{shard_name}.fifo"
-        if not fifo_path.exists():
-            return False, f"FIFO for shard '{shard_name}' not found at {fifo_path}"
-
-        try:
-            # Use the same method as the old implementation to send commands
-            import shlex
-            import subprocess
-
-            shell_cmd = f"echo {shlex.quote(command)} > {shlex.quote(str(fifo_path))}"
-            result = subprocess.run(
-                shell_cmd,
-                shell=True,
-                check=True,
-                timeout=5,
-                capture_output=True,
-                text=True,
-            )
-            return True, "Command sent successfully."
-        except subprocess.TimeoutExpired:
-            return False, f"Timeout sending command to FIFO: {fifo_path}"
-        except subprocess.CalledProcessError as e:
-            return False, f"Failed to send command to FIFO: {e}"
-        except Exception as e:
-            return False, f"Failed to send command to FIFO: {e}"
+        data = (command + "\n").encode("utf-8")
+
+        fd = cls._fifo_handles.get(shard_name)
+        for _ in range(2):
+            try:
+                if fd is None:
+                    # O_NONBLOCK makes open fail with ENXIO instead of
+                    # blocking forever when the shard-side reader is gone
+                    fd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+                    cls._fifo_handles[shard_name] = fd
+                os.write(fd, data)
+                return True, "Command sent successfully."
+            except FileNotFoundError:
+                return False, f"FIFO for shard '{shard_name}' not found at {fifo_path}"
+            except BrokenPipeError:
+                # The reader went away after we cached the handle; drop
+                # it and retry once with a fresh open
+                cls._close_fifo(shard_name)
+                fd = None
+            except OSError as e:
+                cls._close_fifo(shard_name)
+                if e.errno == errno.ENXIO:
+                    return False, f"No reader on FIFO for shard '{shard_name}' at {fifo_path}"
+                return False, f"Failed to send command to FIFO: {e}"
+        return False, f"Failed to send command to FIFO: {fifo_path}"
@@ -3,8 +3,9 @@
 
 """Cluster management feature."""
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from utils.config import ConfigManager
 
@@ -14,6 +15,12 @@ class ClusterManager:
 
     def __init__(self):
         self.config_manager = ConfigManager()
+        # get_cluster_info results keyed by cluster name, tagged with the
+        # cluster directory's mtime so repeat calls cost a single stat
+        self._info_cache: Dict[str, Tuple[float, dict]] = {}
+        # Resolved DONTSTARVE_DIR paired with the config dict it came
+        # from; valid as long as read_config_cached returns that dict
+        self._dst_dir_cache: Optional[Tuple[dict, Path]] = None
 
     def get_available_clusters(self) -> List[str]:
         """Get list of available clusters."""
@@ -21,7 +28,7 @@ class ClusterManager:
 
     def get_current_cluster(self) -> str:
         """Get currently selected cluster."""
-        config = self.config_manager.read_config()
+        config = self.config_manager.read_config_cached()
         return config.get("CLUSTER_NAME", "auto")
 
     def set_cluster(self, cluster_name: str) -> bool:
@@ -29,32 +36,61 @@ class ClusterManager:
         return self.config_manager.update_config_value("CLUSTER_NAME", cluster_name)
 
     def get_cluster_info(self, cluster_name: str) -> Optional[dict]:
-        """Get information about a specific cluster."""
-        config = self.config_manager.read_config()
-        dst_dir = Path(
-            config.get("DONTSTARVE_DIR", "$HOME/.klei/DoNotStarveTogether")
-        ).expanduser()
+        """Get information about a specific cluster.
+
+        The directory walk is memoized against the cluster directory's
+        mtime, so repeat calls (TUI refresh ticks, Discord commands) only
+        pay a stat until the layout actually changes.
+        """
+        config = self.config_manager.read_config_cached()
+        if self._dst_dir_cache is None or self._dst_dir_cache[0] is not config:
+            self._dst_dir_cache = (
+                config,
+                Path(
+                    config.get("DONTSTARVE_DIR", "$HOME/.klei/DoNotStarveTogether")
+                ).expanduser(),
+            )
+        dst_dir = self._dst_dir_cache[1]
 
         cluster_path = dst_dir / cluster_name
-        if not cluster_path.exists():
+        try:
+            st = os.stat(cluster_path)
+        except OSError:
+            self._info_cache.pop(cluster_name, None)
             return None
 
-        cluster_ini = cluster_path / "cluster.ini"
-        cluster_token = cluster_path / "cluster_token.txt"
+        cached = self._info_cache.get(cluster_name)
+        if cached is not None and cached[0] == st.st_mtime:
+            return cached[1]
+
+        # One scandir pass answers the cluster.ini/token checks and the
+        # shard listing together; only shard candidates need an extra stat
+        try:
+            entries = list(os.scandir(cluster_path))
+        except NotADirectoryError:
+            entries = []
+        except OSError:
+            self._info_cache.pop(cluster_name, None)
+            return None
 
         shards = []
-        if cluster_path.is_dir():
-            for item in cluster_path.iterdir():
-                if item.is_dir() and (item / "server.ini").exists():
-                    shards.append(item.name)
-
-        return {
+        names = set()
+        for entry in entries:
+            names.add(entry.name)
+            if entry.is_dir(follow_symlinks=False) and os.path.exists(
+                os.path.join(entry.path, "server.ini")
+            ):
+                shards.append(entry.name)
+
+        info = {
             "name": cluster_name,
             "path": cluster_path,
-            "has_cluster_ini": cluster_ini.exists(),
-            "has_token": cluster_token.exists(),
+            "has_cluster_ini": "cluster.ini" in names,
+            "has_token": "cluster_token.txt" in names,
             "shards": sorted(shards),
         }
+        self._info_cache[cluster_name] = (st.st_mtime, info)
+        return info
 
 
 class BranchManager:
@@ -69,7 +105,7 @@ class BranchManager:
 
     def get_current_branch(self) -> str:
         """Get currently selected branch."""
-        config = self.config_manager.read_config()
+        config = self.config_manager.read_config_cached()
         return config.get("BRANCH", "main")
 
     def set_branch(self, branch_name: str) -> bool:
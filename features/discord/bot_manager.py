@@ -4,6 +4,13 @@
 """Discord bot manager for DST Fish Manager - Refactored version."""
 
 import asyncio
+import collections
+import concurrent.futures
+import hashlib
+import os
+import re
+import threading
+from typing import Optional
 
 from core.events.bus import EventType
 from features.discord.bot_client import DiscordBotClient
@@ -12,6 +19,10 @@ from features.discord.commands.status_commands import StatusCommands
 from features.discord.handlers.error_handlers import ErrorHandlers
 from utils.logger import discord_logger
 
+# Matches the bracketed source tag ("[Say] ", "[Discord] ", ...) that
+# classifies every chat log entry
+_PREFIX_RE = re.compile(r"^\[([^\]]+)\]\s*")
+
 
 class FallBotManager:
     """Manages Discord bot integration with DST Fish Manager."""
@@ -26,7 +37,35 @@ class FallBotManager:
         """
         self.manager_service = manager_service
         self.event_bus = event_bus
-        self.sent_messages = set()  # Track sent message IDs to prevent duplicates
+
+        # Env IDs parsed to int once; message/interaction handlers compare
+        # against these instead of re-parsing the strings per event
+        self.guild_id_int = self._env_id("DISCORD_GUILD_ID")
+        self.chat_channel_id_int = self._env_id("DISCORD_CHAT_CHANNEL_ID")
+        # Track sent message IDs to prevent duplicates: the deque keeps
+        # deterministic FIFO eviction order, the set gives O(1) lookups
+        self._sent_order = collections.deque(maxlen=100)
+        self._sent_ids = set()
+        # Outbound messages are collected here and flushed by a single
+        # scheduled coroutine, so a burst of chat lines costs one
+        # cross-thread hop and one channel.send instead of one each
+        self._outbound = []
+        self._outbound_lock = threading.Lock()
+        self._outbound_scheduled = False
+
+        # Dedicated single worker for long blocking operations (systemctl
+        # fanouts, the updater): keeps them off both the event loop and
+        # the default executor the chat relay shares
+        self._long_ops = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="discord-longop"
+        )
+
+        # Dispatch table keyed by a log entry's bracketed source tag; None
+        # means "recognized but ignored" (Discord echoes would loop back)
+        self._prefix_handlers = {
+            "Say": self._handle_say,
+            "Discord": None,
+        }
 
         # Initialize bot client
         self.client = DiscordBotClient(self.event_bus)
@@ -44,6 +83,16 @@ class FallBotManager:
         if self.event_bus:
             self._setup_event_subscriptions()
 
+    @staticmethod
+    def _env_id(name: str) -> Optional[int]:
+        """Read a Discord snowflake ID from the environment, or None."""
+        value = os.getenv(name)
+        try:
+            return int(value) if value else None
+        except ValueError:
+            discord_logger.warning(f"Invalid {name} value: {value!r}")
+            return None
+
     def _setup_commands(self):
         """Setup bot slash commands."""
         discord_logger.info("Setting up Discord slash commands")
@@ -111,6 +160,45 @@ class FallBotManager:
             # Catch all exceptions to ensure proper error logging
             discord_logger.error(f"Error sending message to Discord: {e}")
 
+    async def run_blocking(self, func, *args):
+        """Run a blocking manager call without stalling the bot loop.
+
+        Command and button handlers should await this for anything that
+        shells out (control_all_shards, run_updater, ...); the call runs
+        on the dedicated long-op worker while the loop keeps heartbeating.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._long_ops, func, *args)
+
+    async def relay_message_to_shards(self, message: str) -> int:
+        """Relay a Discord message to all running shards concurrently.
+
+        send_chat_message wraps a blocking FIFO write, so each shard is
+        dispatched to the default executor and awaited together; latency
+        is the slowest shard's rather than the sum. Returns the number of
+        shards that accepted the message.
+        """
+        shards = self.manager_service.get_shards()
+        loop = asyncio.get_running_loop()
+        tasks = [
+            loop.run_in_executor(
+                None, self.manager_service.send_chat_message, shard.name, message
+            )
+            for shard in shards
+            if shard.is_running
+        ]
+        if not tasks:
+            return 0
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        successes = 0
+        for result in results:
+            if isinstance(result, Exception):
+                discord_logger.warning(f"Error relaying message to shard: {result}")
+            elif result[0]:
+                successes += 1
+        return successes
+
     def set_event_bus(self, event_bus):
         """Set the event bus and setup subscriptions."""
         self.event_bus = event_bus
@@ -127,45 +215,96 @@ class FallBotManager:
         """Handle chat message events to prevent duplicate sending."""
         chat_logs = event.data
         if chat_logs and isinstance(chat_logs, list):
-            # Process all messages but filter out duplicates and non-chat entries
+            # One regex match classifies each entry; dispatch is a dict
+            # lookup, so adding prefixes later stays O(1) per entry
+            handlers = self._prefix_handlers
             for log_entry in chat_logs:
                 if isinstance(log_entry, str):
-                    # Skip Discord messages coming back to avoid loops
-                    if log_entry.startswith("[Discord]"):
+                    m = _PREFIX_RE.match(log_entry)
+                    if not m:
                         continue
-                    
-                    # Only process actual chat messages, not join announcements
-                    if not log_entry.startswith("[Say]"):
+                    handler = handlers.get(m.group(1))
+                    if handler is None:
                         continue
-                    
-                    # Create unique ID using full content to ensure uniqueness
-                    message_id = hash(log_entry.strip())
-                    if message_id not in self.sent_messages:
-                        self.sent_messages.add(message_id)
-                        
-                        # Clean up old message IDs to prevent memory growth
-                        if len(self.sent_messages) > 100:
-                            self.sent_messages = set(list(self.sent_messages)[-50:])
-                        
-                        # Extract just the chat part: "(KU_7veFK1f1) Fornax: test"
-                        chat_part = log_entry.replace("[Say] ", "")
-                        # Message from game, forward to Discord
-                        self._forward_message_to_discord(f"[Game Chat] {chat_part}")
+                    handler(log_entry[m.end():])
+
+    def _handle_say(self, chat_part):
+        """Forward one in-game chat line ("(KU_...) Name: text") to Discord."""
+        # Create a unique ID from the content; blake2b is stable across
+        # restarts, unlike the randomized hash()
+        message_id = hashlib.blake2b(
+            chat_part.strip().encode(), digest_size=8
+        ).digest()
+        if message_id not in self._sent_ids:
+            self._remember_sent(message_id)
+            # Message from game, forward to Discord
+            self._forward_message_to_discord(f"[Game Chat] {chat_part}")
+
+    def _remember_sent(self, message_id) -> None:
+        """Record a sent message ID, evicting the oldest once full."""
+        if len(self._sent_order) == self._sent_order.maxlen:
+            self._sent_ids.discard(self._sent_order[0])
+        self._sent_order.append(message_id)
+        self._sent_ids.add(message_id)
 
     def _forward_message_to_discord(self, message):
-        """Forward chat message to Discord if chat channel is configured."""
+        """Queue a chat message for the next batched send to Discord."""
+        with self._outbound_lock:
+            self._outbound.append(message)
+            if len(self._outbound) > 200:
+                # Bound the backlog like every other buffer here: if the
+                # client loop stays unavailable, keep only the newest
+                # lines instead of growing without limit
+                del self._outbound[:-200]
+            if self._outbound_scheduled:
+                return
+            self._outbound_scheduled = True
+
+        # Schedule a single flush for everything queued so far
+        flush = self._flush_outbound()
         try:
-            chat_channel = self.client.get_chat_channel()
-            if chat_channel and hasattr(chat_channel, 'send'):
-                # Send message to Discord chat channel
-                asyncio.run_coroutine_threadsafe(
-                    chat_channel.send(message),
-                    self.client.client.loop,
-                )
+            asyncio.run_coroutine_threadsafe(flush, self.client.client.loop)
         except Exception as e:  # pylint: disable=broad-exception-caught
-            # Catch all exceptions to ensure proper error logging
+            # Loop missing, not running yet, or closed: clear the flag
+            # so the next message can try again — the queued lines stay
+            # and go out with that flush
+            flush.close()
+            with self._outbound_lock:
+                self._outbound_scheduled = False
             discord_logger.warning(f"Error forwarding message to Discord: {e}")
 
+    async def _flush_outbound(self):
+        """Send all queued outbound messages in as few sends as possible."""
+        with self._outbound_lock:
+            pending = self._outbound
+            self._outbound = []
+            self._outbound_scheduled = False
+        if not pending:
+            return
+
+        chat_channel = self.client.get_chat_channel()
+        if not chat_channel or not hasattr(chat_channel, 'send'):
+            return
+
+        # Join queued lines, respecting Discord's 2000-character limit
+        chunks = []
+        current = ""
+        for line in pending:
+            if current and len(current) + 1 + len(line) > 2000:
+                chunks.append(current)
+                current = line
+            else:
+                current = f"{current}\n{line}" if current else line
+        if current:
+            chunks.append(current)
+
+        for chunk in chunks:
+            try:
+                await chat_channel.send(chunk)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Catch all exceptions to ensure proper error logging
+                discord_logger.warning(f"Error forwarding message to Discord: {e}")
+
     def _forward_message_to_game(self, message):
         """Forward Discord message to game if appropriate."""
         try:
@@ -3,7 +3,8 @@
 
 """Shard manager for handling shard operations."""
 
-from typing import List, Tuple
+import time
+from typing import List, Optional, Tuple
 
 from services.systemd_service import SystemDService
 from utils.config import Shard, read_desired_shards
@@ -14,17 +15,28 @@ class ShardManager:
 
     def __init__(self):
         self.systemd_service = SystemDService()
+        # Short TTL cache over get_shards: bursty callers (UI refresh,
+        # Discord commands) otherwise each pay two systemctl subprocesses.
+        # Control actions invalidate it so state changes show immediately.
+        self._cache: Optional[List[Shard]] = None
+        self._cache_ts = 0.0
+        self._ttl = 1.5
 
     def get_shards(self) -> List[Shard]:
         """
         Reads desired shards from the config file and gets their current status.
         """
-        desired_shards = read_desired_shards()
-        enabled_shards = self.systemd_service.get_systemd_instances(
-            "list-unit-files", "enabled"
-        )
-        running_shards = self.systemd_service.get_systemd_instances(
-            "list-units", "active"
+        if (
+            self._cache is not None
+            and time.monotonic() - self._cache_ts < self._ttl
+        ):
+            return self._cache
+
+        # Preserve shards.conf order while dropping accidental duplicates;
+        # enabled/running come back as sets, so membership below is O(1)
+        desired_shards = list(dict.fromkeys(read_desired_shards()))
+        enabled_shards, running_shards = self.systemd_service.get_shard_states(
+            desired_shards
         )
 
         shards = []
@@ -33,13 +45,21 @@ class ShardManager:
             shard.is_enabled = name in enabled_shards
             shard.is_running = name in running_shards
             shards.append(shard)
+
+        self._cache = shards
+        self._cache_ts = time.monotonic()
         return shards
 
+    def invalidate_cache(self) -> None:
+        """Drop the cached shard list so the next get_shards re-queries."""
+        self._cache_ts = 0.0
+
     def control_shard(self, shard_name: str, action: str) -> Tuple[bool, str, str]:
         """
         Controls a single shard through systemd.
         Returns: (success, stdout, stderr)
         """
+        self.invalidate_cache()
         return self.systemd_service.control_shard(shard_name, action)
 
     def control_all_shards(
@@ -50,6 +70,7 @@ class ShardManager:
         Returns: (success, stdout, stderr)
         """
         names = [shard.name for shard in shard_list]
+        self.invalidate_cache()
         return self.systemd_service.control_all_shards(action, names)
 
     def get_logs(self, shard_name: str, lines: int = 50) -> str:
@@ -61,4 +82,5 @@ class ShardManager:
         Synchronizes systemd units with shards.conf.
         """
         desired_names = set(read_desired_shards())
+        self.invalidate_cache()
         self.systemd_service.sync_shards_and_target(desired_names)
@@ -11,10 +11,80 @@ from typing import Dict, Optional
 
 from utils.config import get_game_config
 
+# Compiled once at import; _parse_shard_log runs every status refresh and
+# recompiling these per call dominated its regex cost
+
+# Patterns operate on bytes: the 32KB tail is matched undecoded and only
+# the small captured groups pay for UTF-8 decoding
+
+# Season/day/remaining from c_dumpseasons() output
+_SEASON_DUMP_RE = re.compile(
+    rb"(?:\[Season\] Season:\s*|:\s*)(\w+)\s*(\d+)\s*(?:,\s*Remaining:|\s*->)\s*(\d+)\s*days?"
+)
+
+# Fallback season patterns when c_dumpseasons output is absent
+_SEASON_FALLBACK_RES = [
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+    for pattern in (
+        rb"^(autumn|spring|summer|winter) \d+ -> \d+ days \(\d+ %\) cycle",
+        rb"World \d+ is now in (\w+)",
+        rb"Season: (\w+)",
+        rb"Current season: (\w+)",
+        rb"Setting season to (\w+)",
+        rb"\[Shard\] Season: (\w+)",
+        rb"Season is now (\w+)",
+        rb"Season changed to (\w+)",
+    )
+]
+
+_DAY_RE = re.compile(rb"(?:Current day:|\[World State\] day:)\s*(\d+)")
+
+# Days-left fallbacks paired with the capture group holding the count
+_DAYS_LEFT_RES = [
+    (re.compile(pattern, re.MULTILINE | re.IGNORECASE), group)
+    for pattern, group in (
+        (rb"^(autumn|spring|summer|winter) \d+ -> (\d+) days \(\d+ %\) cycle", 2),
+        (rb"Days left in season: (\d+)", 1),
+        (rb"Season days remaining: (\d+)", 1),
+        (rb"Days until season change: (\d+)", 1),
+        (rb"Season will end in (\d+) days", 1),
+        (rb"(\d+) days left in this season", 1),
+    )
+]
+
+_PHASE_RES = [
+    re.compile(pattern)
+    for pattern in (
+        rb"Current phase: (\w+)",
+        rb"Clock phase: (\w+)",
+        rb"Phase: (\w+)",
+    )
+]
+
+# c_listallplayers() entries: "[id] (KU_id) name <char>", with and
+# without the numeric prefix
+_PLAYER_FULL_RE = re.compile(rb"\[(\d+)\]\s+\((KU_[\w-]+)\)\s+(.*?)\s+<(.*?)>")
+_PLAYER_FULL_ALT_RE = re.compile(rb"\[(\d+)\]\s+\((KU_[\w-]+)\)\s+(.*?)\s+<([^>]+)>")
+_PLAYER_BARE_RE = re.compile(rb"\s+\((KU_[\w-]+)\)\s+(.*?)\s+<(.*?)>")
+
 
 class StatusManager:
     """Manages server status operations."""
 
+    # Per-log incremental parse state keyed by log path: byte offset and
+    # inode of the last read plus the merged status so far. When nothing
+    # was appended, a status refresh costs one stat; otherwise only the
+    # delta is decoded and matched.
+    _parse_cache: Dict[str, dict] = {}
+
+    # When the last player dump was seen per shard, so redundant dump
+    # requests can be coalesced
+    _last_dump_time: Dict[str, float] = {}
+
+    # Resolved log paths keyed by (dst_dir, cluster, shard); saves four
+    # Path joins per shard per refresh
+    _log_paths: Dict[tuple, Path] = {}
+
     @staticmethod
     def _get_default_status() -> Dict:
         """Get default status structure."""
@@ -27,160 +97,200 @@ class StatusManager:
             "shards": {},
         }
 
-    @staticmethod
-    def _parse_shard_log(log_path: Path) -> Dict:
-        """Parse individual shard log file for status information."""
-        shard_status = {}
+    @classmethod
+    def _parse_shard_log(cls, log_path: Path) -> Dict:
+        """Parse individual shard log file for status information.
 
-        if not log_path.exists():
+        Incremental: results are cached per log file and only the bytes
+        appended since the previous call are read and matched, with new
+        findings merged over the cached status. Rotation or truncation
+        restarts from the last 32KB, matching the original window.
+        """
+        key = str(log_path)
+        try:
+            st = os.stat(log_path)
+        except OSError:
+            cls._parse_cache.pop(key, None)
             return {"error": f"Log file not found: {log_path}"}
 
+        entry = cls._parse_cache.get(key)
+        if entry is not None and entry["inode"] == st.st_ino:
+            if st.st_size == entry["offset"]:
+                return entry["status"]
+            if st.st_size < entry["offset"]:
+                entry = None  # Truncated; start over
+        else:
+            entry = None
+
+        # Never parse more than the trailing 32KB in one go, even after a
+        # long gap — only the latest values matter
+        start = max(entry["offset"] if entry else 0, st.st_size - 32768, 0)
+        partial = entry["partial"] if entry else b""
+        skipped_history = entry is not None and start > entry["offset"]
+        if skipped_history:
+            # The window jumped past unread bytes: the held partial no
+            # longer abuts what we are about to read, so splicing them
+            # would fabricate a line that never existed
+            partial = b""
+
         try:
-            # Read only the last 32KB of the log file for better performance
-            # and to focus on the most recent information
             with open(log_path, "rb") as f:
-                f.seek(0, os.SEEK_END)
-                size = f.tell()
-                f.seek(max(0, size - 32768), os.SEEK_SET)
-                content = f.read().decode("utf-8", errors="ignore")
-
-            # Parse Season and Day from c_dumpseasons() - using approach from old implementation
-            season_matches = re.findall(
-                r"(?:\[Season\] Season:\s*|:\s*)(\w+)\s*(\d+)\s*(?:,\s*Remaining:|\s*->)\s*(\d+)\s*days?",
-                content,
+                f.seek(start, os.SEEK_SET)
+                content = partial + f.read()
+                offset = f.tell()
+
+            # A poll can land mid-write and read a torn line (half a
+            # player dump, a truncated number); parsing it would poison
+            # the merged status until the next dump. Consume only whole
+            # lines and hold the tail for the next read, same as the
+            # chat tail reader
+            cut = content.rfind(b"\n") + 1
+            partial = content[cut:]
+            content = content[:cut]
+            if skipped_history:
+                # The jump rarely lands on a line boundary; the first
+                # line is torn too
+                content = content[content.find(b"\n") + 1 :]
+
+            delta = cls._parse_status_content(content)
+        except (OSError, ValueError, KeyError) as e:
+            return {"error": f"Error parsing shard log: {e}"}
+
+        status = dict(entry["status"]) if entry else {}
+        for field in ("season", "day", "days_left", "phase"):
+            if field in delta:
+                status[field] = delta[field]
+        # Replace the player list only when the delta carries a new dump
+        # marker; player lines without one continue a block whose head a
+        # previous read already consumed, so they merge instead of
+        # replacing (and dropping) that head
+        if b"All players:" in content:
+            status["players"] = delta["players"]
+        elif delta["players"]:
+            merged = list(status.get("players", []))
+            known = {player["name"] for player in merged}
+            merged.extend(
+                player for player in delta["players"] if player["name"] not in known
             )
-            if season_matches:
-                s_name, s_elapsed, s_rem = season_matches[-1]
-                shard_status["season"] = s_name.capitalize()
-                shard_status["day"] = str(int(s_elapsed) + 1)
-                shard_status["days_left"] = s_rem
-            else:
-                # Fallback to simpler patterns if c_dumpseasons output not found
-                season_patterns = [
-                    r"^(autumn|spring|summer|winter) \d+ -> \d+ days \(\d+ %\) cycle",
-                    r"World \d+ is now in (\w+)",
-                    r"Season: (\w+)",
-                    r"Current season: (\w+)",
-                    r"Setting season to (\w+)",
-                    r"\[Shard\] Season: (\w+)",
-                    r"Season is now (\w+)",
-                    r"Season changed to (\w+)",
-                ]
-                for pattern in season_patterns:
-                    season_match = re.search(
-                        pattern, content, re.MULTILINE | re.IGNORECASE
-                    )
-                    if season_match:
-                        shard_status["season"] = season_match.group(1).capitalize()
-                        break
-
-            # Parse Day from explicit poll or natural World State logs
-            if shard_status.get("day") == "Unknown":
-                day_matches = re.findall(
-                    r"(?:Current day:|\[World State\] day:)\s*(\d+)", content
-                )
-                if day_matches:
-                    last_match = day_matches[-1]
-                    if f"Current day: {last_match}" in content:
-                        shard_status["day"] = last_match
-                    else:
-                        shard_status["day"] = str(int(last_match) + 1)
-
-            # Parse days left if not already set by c_dumpseasons
-            if shard_status.get("days_left") == "Unknown":
-                days_left_patterns = [
-                    r"^(autumn|spring|summer|winter) \d+ -> (\d+) days \(\d+ %\) cycle",
-                    r"Days left in season: (\d+)",
-                    r"Season days remaining: (\d+)",
-                    r"Days until season change: (\d+)",
-                    r"Season will end in (\d+) days",
-                    r"(\d+) days left in this season",
-                ]
-                for pattern in days_left_patterns:
-                    days_left_match = re.search(
-                        pattern, content, re.MULTILINE | re.IGNORECASE
-                    )
-                    if days_left_match:
-                        if pattern.startswith("^(autumn|spring|summer|winter)"):
-                            shard_status["days_left"] = int(days_left_match.group(2))
-                        else:
-                            shard_status["days_left"] = int(days_left_match.group(1))
-                        break
-
-            # Extract phase information - multiple patterns
-            phase_patterns = [
-                r"Current phase: (\w+)",
-                r"Clock phase: (\w+)",
-                r"Phase: (\w+)",
-            ]
-            for pattern in phase_patterns:
-                phase_match = re.search(pattern, content)
-                if phase_match:
-                    shard_status["phase"] = phase_match.group(1)
-                    break
-
-            # Extract players - focus on recent activity and listallplayers output
-            players = []
-            seen_players = set()
-            all_players = {}  # Track all players across shards using KU_ID as key
-
-            # Pattern for c_listallplayers output - look for actual player list
-            # After c_listallplayers() command, server outputs player data
-            player_pattern_list = re.compile(r"\[(\w+)\]\s*(\d+)")
-            player_pattern_ku = re.compile(r"(\w+)\s*(\d+)")
-
-            # Pattern for chat messages: "[Say] (KU_xxx) PlayerName: message"
-            player_pattern_chat = re.compile(r"\[Say\] \([^)]+\) (\w+):")
+            status["players"] = merged
+        elif "players" not in status:
+            status["players"] = []
+
+        cls._parse_cache[key] = {
+            "inode": st.st_ino,
+            "offset": offset,
+            "partial": partial,
+            "status": status,
+        }
 
-            # Pattern for join announcements: "[Join Announcement] PlayerName"
-            player_pattern_join = re.compile(r"\[Join Announcement\] (\w+)")
+        # A dump in the delta means the status is as fresh as it gets;
+        # note when, so request_status_update can coalesce
+        if b"All players:" in content:
+            cls._last_dump_time[log_path.parent.name] = time.time()
 
-            # Pattern for character information: "PlayerName (character_name)"
-            player_char_pattern = re.compile(r"(\w+)\s+\(([^)]+)\)")
+        return status
 
-            # Parse Players using the approach from the old implementation
-            # Split content by "All players:" marker to find the player list section
-            dumps = content.split("All players:")
-            last_dump = dumps[-1] if dumps else content
+    @staticmethod
+    def _parse_status_content(content: bytes) -> Dict:
+        """Run the status regexes over a chunk of raw log bytes.
 
-            # Try multiple patterns to find players
-            player_matches = []
+        Matching happens on undecoded bytes; only captured groups are
+        decoded, so the bulk of the tail never becomes a str.
+        """
+        shard_status = {}
 
-            # Pattern 1: [id] (KU_id) name <char>
-            pattern1_matches = re.findall(
-                r"\[(\d+)\]\s+\((KU_[\w-]+)\)\s+(.*?)\s+<(.*?)>", last_dump
-            )
-            if pattern1_matches:
-                for match in pattern1_matches:
-                    player_matches.append((match[1], match[2], match[3]))
+        # Parse Season and Day from c_dumpseasons() - using approach from old implementation
+        season_matches = _SEASON_DUMP_RE.findall(content)
+        if season_matches:
+            s_name, s_elapsed, s_rem = season_matches[-1]
+            shard_status["season"] = s_name.decode("utf-8", "ignore").capitalize()
+            shard_status["day"] = str(int(s_elapsed) + 1)
+            shard_status["days_left"] = s_rem.decode("ascii", "ignore")
+        else:
+            # Fallback to simpler patterns if c_dumpseasons output not found
+            for pattern in _SEASON_FALLBACK_RES:
+                season_match = pattern.search(content)
+                if season_match:
+                    shard_status["season"] = (
+                        season_match.group(1).decode("utf-8", "ignore").capitalize()
+                    )
+                    break
 
-            # Pattern 2: [id] (KU_id) name <char> (alternative format)
-            pattern2_matches = re.findall(
-                r"\[(\d+)\]\s+\((KU_[\w-]+)\)\s+(.*?)\s+<([^>]+)>", last_dump
-            )
-            if pattern2_matches:
-                for match in pattern2_matches:
-                    player_matches.append((match[1], match[2], match[3]))
+        # Parse Day from explicit poll or natural World State logs
+        if shard_status.get("day") == "Unknown":
+            day_matches = _DAY_RE.findall(content)
+            if day_matches:
+                last_match = day_matches[-1]
+                if b"Current day: " + last_match in content:
+                    shard_status["day"] = last_match.decode("ascii")
+                else:
+                    shard_status["day"] = str(int(last_match) + 1)
+
+        # Parse days left if not already set by c_dumpseasons
+        if shard_status.get("days_left") == "Unknown":
+            for pattern, group in _DAYS_LEFT_RES:
+                days_left_match = pattern.search(content)
+                if days_left_match:
+                    shard_status["days_left"] = int(days_left_match.group(group))
+                    break
 
-            # Pattern 3: (KU_id) name <char> (without [id] prefix)
-            pattern3_matches = re.findall(
-                r"\s+\((KU_[\w-]+)\)\s+(.*?)\s+<(.*?)>", last_dump
+        # Extract phase information - multiple patterns
+        for pattern in _PHASE_RES:
+            phase_match = pattern.search(content)
+            if phase_match:
+                shard_status["phase"] = phase_match.group(1).decode("utf-8", "ignore")
+                break
+
+        # Extract players - focus on recent activity and listallplayers output.
+        # Parse Players using the approach from the old implementation.
+        # Only the section after the last "All players:" marker matters;
+        # rfind locates it without materializing any split list, and a
+        # dump block is small, so the regex input is capped at 4KB
+        idx = content.rfind(b"All players:")
+        if idx >= 0:
+            last_dump = content[idx : idx + 4096]
+        else:
+            last_dump = content
+
+        # Try multiple patterns to find players
+        player_matches = []
+
+        # Pattern 1: [id] (KU_id) name <char>
+        pattern1_matches = _PLAYER_FULL_RE.findall(last_dump)
+        if pattern1_matches:
+            for match in pattern1_matches:
+                player_matches.append((match[1], match[2], match[3]))
+
+        # Pattern 2: [id] (KU_id) name <char> (alternative format)
+        pattern2_matches = _PLAYER_FULL_ALT_RE.findall(last_dump)
+        if pattern2_matches:
+            for match in pattern2_matches:
+                player_matches.append((match[1], match[2], match[3]))
+
+        # Pattern 3: (KU_id) name <char> (without [id] prefix)
+        pattern3_matches = _PLAYER_BARE_RE.findall(last_dump)
+        if pattern3_matches:
+            for match in pattern3_matches:
+                player_matches.append(match)
+
+        # Dedup on KU_ID in one reverse pass so the most recent entry
+        # wins; decoding only first-seen matches keeps duplicates from
+        # allocating strings at all
+        seen_ids = set()
+        players = []
+        for ku_id, name, char in reversed(player_matches):
+            if ku_id in seen_ids:
+                continue
+            seen_ids.add(ku_id)
+            players.append(
+                {
+                    "name": name.decode("utf-8", "ignore"),
+                    "char": char.decode("utf-8", "ignore"),
+                }
             )
-            if pattern3_matches:
-                for match in pattern3_matches:
-                    player_matches.append(match)
+        players.reverse()
 
-            shard_players = {}
-            if player_matches:
-                for ku_id, name, char in player_matches:
-                    # Use KU_ID as key to avoid duplicates and ensure uniqueness
-                    shard_players[ku_id] = {"name": name, "char": char}
-                    all_players[ku_id] = {"name": name, "char": char}
-
-            shard_status["players"] = list(shard_players.values())
-
-        except (OSError, ValueError, KeyError) as e:
-            shard_status["error"] = f"Error parsing shard log: {e}"
+        shard_status["players"] = players
 
         return shard_status
 
@@ -204,17 +314,17 @@ class StatusManager:
         all_players = {}  # Track all players across shards using KU_ID as key
 
         for current_shard in shard_names:
-            log_path = dst_dir / cluster_name / current_shard / "server_log.txt"
-
-            if not log_path.exists():
-                combined_status["shards"][current_shard] = {
-                    "error": f"Log file not found for shard '{current_shard}'",
-                    "players": [],
-                }
-                continue
-
-            # Parse shard status using helper method
+            path_key = (str(dst_dir), cluster_name, current_shard)
+            log_path = StatusManager._log_paths.get(path_key)
+            if log_path is None:
+                log_path = dst_dir / cluster_name / current_shard / "server_log.txt"
+                StatusManager._log_paths[path_key] = log_path
+
+            # Parse shard status using helper method; the parser's own
+            # stat doubles as the existence check, so no pre-stat here
             shard_status = StatusManager._parse_shard_log(log_path)
+            if "error" in shard_status:
+                shard_status.setdefault("players", [])
 
             # Update combined status with valid shard data
             if "error" not in shard_status:
@@ -233,8 +343,8 @@ class StatusManager:
 
         return combined_status
 
-    @staticmethod
-    def request_status_update(shard_name: Optional[str] = None) -> bool:
+    @classmethod
+    def request_status_update(cls, shard_name: Optional[str] = None) -> bool:
         """Sends Lua commands to the server to dump current status into the logs."""
         from features.chat.chat_manager import ChatManager  # noqa: C0415
         from utils.config import read_desired_shards  # noqa: C0415
@@ -245,21 +355,31 @@ class StatusManager:
         else:
             shard_names = [shard_name]
 
-        commands = [
-            "c_dumpseasons()",
-            'print("Current day: " .. (TheWorld.components.worldstate.data.cycles + 1))',
-            'print("Current phase: " .. TheWorld.components.worldstate.data.phase)',
-            "c_listallplayers()",
+        # Coalesce: a dump parsed moments ago is still fresh, no need to
+        # push another round of commands at the server
+        now = time.time()
+        shard_names = [
+            s for s in shard_names if now - cls._last_dump_time.get(s, 0.0) >= 5.0
         ]
+        if not shard_names:
+            return True
+
+        # The console accepts ;-separated Lua, so the whole dump is one
+        # statement: one FIFO write per shard and no pacing sleeps
+        combined = "; ".join(
+            [
+                "c_dumpseasons()",
+                'print("Current day: " .. (TheWorld.components.worldstate.data.cycles + 1))',
+                'print("Current phase: " .. TheWorld.components.worldstate.data.phase)',
+                "c_listallplayers()",
+            ]
+        )
 
         overall_success = True
 
         for current_shard in shard_names:
-            for cmd in commands:
-                s, _ = ChatManager.send_command(current_shard, cmd)
-                if not s:
-                    overall_success = False
-                # Increased delay to give server more time to process commands
-                time.sleep(1.0)
+            s, _ = ChatManager.send_command(current_shard, combined)
+            if not s:
+                overall_success = False
 
         return overall_success
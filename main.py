@@ -15,6 +15,7 @@ sys.path.insert(0, str(project_root))
 from utils.env_loader import load_env_file  # noqa: E402
 from ui.app import main  # noqa: E402
 from services.manager_service import ManagerService  # noqa: E402
+from features.chat.chat_manager import ChatManager  # noqa: E402
 
 load_env_file()
 
@@ -34,5 +35,6 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         pass
     finally:
-        # Stop Discord bot on exit
+        # Stop Discord bot and release cached FIFO handles on exit
         manager_service.stop_discord_bot()
+        ChatManager.close_fifo_handles()
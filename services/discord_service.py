@@ -4,6 +4,7 @@
 """Discord service for running the bot in the background."""
 
 import asyncio
+import concurrent.futures
 import os
 import threading
 import traceback
@@ -30,6 +31,13 @@ class DiscordService:
         self.bot_manager: Optional[FallBotManager] = None
         self.bot_thread: Optional[threading.Thread] = None
         self.is_running = False
+        self._ready: Optional[concurrent.futures.Future] = None
+
+    def wait_ready(self, timeout: Optional[float] = None) -> Optional[FallBotManager]:
+        """Block until the bot manager exists (or raise its startup error)."""
+        if self._ready is None:
+            return None
+        return self._ready.result(timeout=timeout)
 
     def set_event_bus(self, event_bus):
         """Set the event bus for chat message subscription."""
@@ -48,14 +56,37 @@ class DiscordService:
 
         try:
             discord_logger.info("Starting Discord service")
-            self.bot_manager = FallBotManager(self.manager_service, self.event_bus)
-            # If event bus was set before bot manager was created, set it now
-            if self.event_bus:
-                self.bot_manager.set_event_bus(self.event_bus)
+            # Construction (discord.py import, intents setup) happens on
+            # the bot thread so TUI startup is not blocked; the future
+            # resolves once the manager exists, for callers that need it
+            self._ready = concurrent.futures.Future()
 
             # Start bot in background thread
             # Since bot_manager.start() is async, we need to run it in an async context
             def run_bot():
+                # uvloop's libuv-based loop cuts per-frame websocket
+                # overhead; fall back to the stock loop when absent
+                try:
+                    import uvloop  # noqa: C0415
+
+                    uvloop.install()
+                except ImportError:
+                    pass
+
+                try:
+                    self.bot_manager = FallBotManager(
+                        self.manager_service, self.event_bus
+                    )
+                    # If event bus was set before bot manager was
+                    # created, set it now
+                    if self.event_bus:
+                        self.bot_manager.set_event_bus(self.event_bus)
+                except Exception as e:
+                    self._ready.set_exception(e)
+                    discord_logger.error(f"Error in Discord bot thread: {e}")
+                    return
+                self._ready.set_result(self.bot_manager)
+
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
                 try:
@@ -62,6 +62,10 @@ class ManagerService:
         """Gets the latest chat messages from the game chat log."""
         return ChatManager.get_chat_logs(lines)
 
+    def get_chat_log_size(self) -> int:
+        """Byte size of the chat log (-1 if missing); cheap idle check."""
+        return ChatManager.get_chat_log_size()
+
     def run_updater(self):
         """Runs the dst-updater script."""
         possible_paths = [
@@ -3,19 +3,43 @@
 
 """SystemD service for managing DST shards."""
 
+import concurrent.futures
 import shutil
 import subprocess
 from typing import List, Set, Tuple
 
-from utils.config import UNIT_PREFIX, UNIT_SUFFIX
+from utils.config import UNIT_PREFIX, UNIT_SUFFIX, unit_name
+
+# Optional: query unit state over the user bus directly instead of
+# forking systemctl; the subprocess path stays as the fallback
+try:
+    from pystemd.dbuslib import DBus
+    from pystemd.systemd1 import Manager as SdManager
+except ImportError:
+    DBus = None
+    SdManager = None
+
+# The enabled and running probes are independent systemctl invocations,
+# both fork+exec+wait bound, so paths that need both run them in parallel
+_probe_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="systemctl-probe"
+)
 
 
 class SystemDService:
     """Handles all SystemD operations for DST shards."""
 
     @staticmethod
-    def _run_systemctl_command(args: list[str]) -> Tuple[bool, str, str]:
-        """Runs a systemctl command and returns success, stdout, and stderr."""
+    def _run_systemctl_command(
+        args: list[str], decode: bool = True, timeout: float = 30.0
+    ) -> Tuple[bool, str, str]:
+        """Runs a systemctl command and returns success, stdout, and stderr.
+
+        Pass decode=False for control verbs whose stdout is never
+        inspected; stderr is still decoded on failure so errors surface
+        readably. The timeout keeps a hung systemctl from stalling the
+        calling thread forever.
+        """
         try:
             systemctl_path = shutil.which("systemctl")
             if not systemctl_path:
@@ -25,14 +49,18 @@ class SystemDService:
             process = subprocess.run(
                 [systemctl_path, "--user", *args],
                 capture_output=True,
-                text=True,
+                text=decode,
                 check=False,
+                timeout=timeout,
             )
-            return (
-                process.returncode == 0,
-                process.stdout.strip(),
-                process.stderr.strip(),
-            )
+            success = process.returncode == 0
+            if decode:
+                return success, process.stdout.strip(), process.stderr.strip()
+            if success:
+                return True, "", ""
+            return False, "", process.stderr.decode("utf-8", "replace").strip()
+        except subprocess.TimeoutExpired:
+            return False, "", f"systemctl timed out after {timeout:.0f}s."
         except FileNotFoundError:
             return False, "", "systemctl command not found."
 
@@ -53,27 +81,110 @@ class SystemDService:
             return set()
 
         instances = set()
+        check_state_column = command == "list-unit-files"
         for line in stdout.splitlines():
-            parts = line.split()
+            # Only the first two columns matter; maxsplit keeps the rest
+            # of the row as one unsplit chunk
+            parts = line.split(None, 2)
             if not parts:
                 continue
 
             unit_file = parts[0]
             # For list-unit-files, the state is in the second column
-            if command == "list-unit-files" and len(parts) > 1:
-                unit_state = parts[1]
-                if unit_state != state_filter:
-                    continue
+            if check_state_column and len(parts) > 1 and parts[1] != state_filter:
+                continue
 
-            # Extract shard name from 'dontstarve@SHARD.service'
-            if unit_file.startswith(UNIT_PREFIX) and unit_file.endswith(UNIT_SUFFIX):
-                shard_name = unit_file.removeprefix(UNIT_PREFIX).removesuffix(
-                    UNIT_SUFFIX
-                )
-                if shard_name:
-                    instances.add(shard_name)
+            # Extract shard name from 'dontstarve@SHARD.service'; an
+            # unchanged length after removeprefix/removesuffix means the
+            # affix was absent, so no separate startswith/endswith scans
+            shard_name = unit_file.removeprefix(UNIT_PREFIX)
+            if len(shard_name) == len(unit_file):
+                continue
+            stripped = shard_name.removesuffix(UNIT_SUFFIX)
+            if stripped and len(stripped) != len(shard_name):
+                instances.add(stripped)
         return instances
 
+    @classmethod
+    def get_shard_states(cls, shard_names: List[str]) -> Tuple[Set[str], Set[str]]:
+        """
+        Queries enabled and running state for the given shards in one call.
+
+        Uses a single `systemctl show` covering every unit instead of
+        separate list-unit-files and list-units invocations, halving the
+        fork/exec cost of a status refresh. Returns (enabled, running)
+        name sets; falls back to the two-call path if the query fails.
+        """
+        if not shard_names:
+            return set(), set()
+
+        if SdManager is not None:
+            try:
+                return cls._get_shard_states_sdbus(shard_names)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Bus unavailable or API mismatch; use the CLI below
+                pass
+
+        unit_names = [unit_name(name) for name in shard_names]
+        success, stdout, _ = cls._run_systemctl_command(
+            ["show", "-p", "Id", "-p", "ActiveState", "-p", "UnitFileState"]
+            + unit_names
+        )
+        if not success:
+            enabled_f = _probe_pool.submit(
+                cls.get_systemd_instances, "list-unit-files", "enabled"
+            )
+            running = cls.get_systemd_instances("list-units", "active")
+            return enabled_f.result(), running
+
+        enabled = set()
+        running = set()
+        # Output is one Key=Value block per unit, blank-line separated
+        for block in stdout.split("\n\n"):
+            props = dict(
+                line.split("=", 1) for line in block.splitlines() if "=" in line
+            )
+            unit = props.get("Id", "")
+            if not (unit.startswith(UNIT_PREFIX) and unit.endswith(UNIT_SUFFIX)):
+                continue
+            name = unit.removeprefix(UNIT_PREFIX).removesuffix(UNIT_SUFFIX)
+            if props.get("UnitFileState") == "enabled":
+                enabled.add(name)
+            if props.get("ActiveState") == "active":
+                running.add(name)
+        return enabled, running
+
+    @classmethod
+    def _get_shard_states_sdbus(
+        cls, shard_names: List[str]
+    ) -> Tuple[Set[str], Set[str]]:
+        """Queries unit states over the user bus via pystemd.
+
+        One bus connection replaces the systemctl fork+exec round-trip.
+        Errors propagate so the caller can fall back to the CLI path.
+        """
+        enabled = set()
+        running = set()
+        with DBus(user_mode=True) as bus, SdManager(bus=bus) as manager:
+            units = manager.Manager.ListUnitsByPatterns(
+                [], [f"{UNIT_PREFIX}*{UNIT_SUFFIX}".encode()]
+            )
+            active_units = {
+                unit[0].decode() for unit in units if unit[3] == b"active"
+            }
+            for name in shard_names:
+                unit = unit_name(name)
+                if unit in active_units:
+                    running.add(name)
+                try:
+                    state = manager.Manager.GetUnitFileState(unit.encode())
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # Unknown unit file; treat as not enabled
+                    continue
+                if state == b"enabled":
+                    enabled.add(name)
+        return enabled, running
+
     @classmethod
     def control_shard(cls, shard_name: str, action: str) -> Tuple[bool, str, str]:
         """
@@ -94,31 +205,52 @@ class SystemDService:
         if not shard_list:
             return True, "", ""
 
-        unit_names = [f"{UNIT_PREFIX}{name}{UNIT_SUFFIX}" for name in shard_list]
-        return cls._run_systemctl_command([action] + unit_names)
+        unit_names = [unit_name(name) for name in shard_list]
+        success, stdout, stderr = cls._run_systemctl_command(
+            [action] + unit_names, decode=False
+        )
+        if success or len(unit_names) == 1:
+            return success, stdout, stderr
+
+        # One bad unit fails the whole batch; retry individually so the
+        # healthy shards still get the action, and report only the units
+        # that actually failed
+        failures = []
+        for unit in unit_names:
+            unit_ok, _, unit_err = cls._run_systemctl_command(
+                [action, unit], decode=False
+            )
+            if not unit_ok:
+                failures.append(f"{unit}: {unit_err}")
+        return not failures, stdout, "\n".join(failures)
 
     @classmethod
     def get_logs(cls, shard_name: str, lines: int = 50) -> str:
         """Gets the latest journalctl logs for a shard."""
-        unit_name = f"{UNIT_PREFIX}{shard_name}{UNIT_SUFFIX}"
         try:
             journalctl_path = shutil.which("journalctl")
             if not journalctl_path:
                 return "journalctl command not found."
+            args = [
+                journalctl_path,
+                "--user",
+                "-u",
+                unit_name(shard_name),
+                "-n",
+                str(lines),
+                "--no-pager",
+                "-o",
+                "cat",
+            ]
+            if lines <= 500:
+                # Bounding the window to the current boot lets journald
+                # skip whole journal files instead of walking the full
+                # history just to keep the last N lines
+                args.append("-b")
             # nosemgrep: gitlab.security.b603
             # Safe subprocess call: uses list argument, validated executable path, no shell=True
             process = subprocess.run(
-                [
-                    journalctl_path,
-                    "--user",
-                    "-u",
-                    unit_name,
-                    "-n",
-                    str(lines),
-                    "--no-pager",
-                    "-o",
-                    "cat",
-                ],
+                args,
                 capture_output=True,
                 text=True,
                 check=False,
@@ -137,21 +269,28 @@ class SystemDService:
         Synchronizes systemd units with a set of desired shards.
         Enables and starts desired shards, disables and stops others.
         """
-        enabled_names = cls.get_systemd_instances("list-unit-files", "enabled")
-        running_names = cls.get_systemd_instances("list-units", "active")
+        # Strays have to be discovered by globbing — `systemctl show` only
+        # answers about units it is given by name — so this path keeps the
+        # list commands. Only the union matters: anything enabled or
+        # running that is not desired gets pruned the same way.
+        enabled_f = _probe_pool.submit(
+            cls.get_systemd_instances, "list-unit-files", "enabled"
+        )
+        all_managed_names = (
+            cls.get_systemd_instances("list-units", "active") | enabled_f.result()
+        )
 
-        # Enable and start desired shards (batching is more efficient)
+        # Enable and start desired shards; --now fuses both into one
+        # systemctl call, same as the target line below
         if desired_shards:
-            list_to_enable = list(desired_shards)
-            cls.control_all_shards("enable", list_to_enable)
-            cls.control_all_shards("start", list_to_enable)
+            desired_units = [unit_name(name) for name in desired_shards]
+            cls._run_systemctl_command(["enable", "--now", *desired_units], decode=False)
 
         # Disable and stop shards not in the desired list
-        all_managed_names = enabled_names.union(running_names)
         to_remove = [name for name in all_managed_names if name not in desired_shards]
         if to_remove:
-            cls.control_all_shards("stop", to_remove)
-            cls.control_all_shards("disable", to_remove)
+            prune_units = [unit_name(name) for name in to_remove]
+            cls._run_systemctl_command(["disable", "--now", *prune_units], decode=False)
 
         # Ensure the main target is enabled and started
-        cls._run_systemctl_command(["enable", "--now", "dontstarve.target"])
+        cls._run_systemctl_command(["enable", "--now", "dontstarve.target"], decode=False)
@@ -16,6 +16,10 @@ from ui.input.handler import InputHandler
 from ui.rendering.renderer import Renderer
 from utils.logger import discord_logger
 
+# How long getch() blocks waiting for input before the loop wakes up to
+# service timers and redraws (milliseconds).
+FRAME_TIMEOUT_MS = 100
+
 
 class TUIApp:
     """Main TUI application class."""
@@ -74,7 +78,9 @@ class TUIApp:
     def _setup_curses(self) -> None:
         """Setup curses settings."""
         curses.curs_set(0)
-        self.stdscr.nodelay(1)
+        # Block in getch() for up to one frame instead of busy-polling;
+        # the kernel wakes us on input, so no per-iteration sleep is needed.
+        self.stdscr.timeout(FRAME_TIMEOUT_MS)
 
     def _setup_callbacks(self) -> None:
         """Setup input handler callbacks."""
@@ -111,23 +117,21 @@ class TUIApp:
         self.background_coordinator.run_in_background(lambda: None)
 
         while running:
-            current_time = time.time()
-            state = self.state_manager.state
-
-            # Process input
+            # Process input (getch blocks up to FRAME_TIMEOUT_MS, so this
+            # loop idles in the kernel rather than spinning)
             if self.input_handler.process_input(self.stdscr):
                 running = False
                 continue
 
+            current_time = time.time()
+            state = self.state_manager.state
+
             # Draw if needed (at most 30 FPS)
             if state.need_redraw and (current_time - state.last_draw_time > 0.033):
                 self.renderer.render()
                 self.state_manager.clear_redraw_flag()
                 self.state_manager.update_timing(last_draw_time=current_time)
 
-            # Small sleep to prevent 100% CPU
-            time.sleep(0.01)
-
         # Cleanup
         self.background_coordinator.stop()
 
@@ -187,6 +191,7 @@ class TUIApp:
     def _prompt_chat(self) -> None:
         """Prompt for chat message."""
         message = self.renderer.popup_manager.text_input_popup("Chat:", width=60)
+        self.renderer.invalidate()
         if message:
             # Send message to game and publish event for Discord forwarding
             success, _ = self.manager_service.send_chat_message("Master", message)
@@ -241,6 +246,7 @@ class TUIApp:
         """Handle terminal resize."""
         self.stdscr.clear()
         self.renderer.window_manager.create_layout()
+        self.renderer.invalidate()
 
     def _toggle_discord_bot(self) -> None:
         """Toggle Discord bot on/off via F10."""
@@ -290,6 +296,7 @@ class TUIApp:
     def _prompt_add_mod(self) -> None:
         """Prompt for mod ID to add."""
         mod_id = self.renderer.popup_manager.text_input_popup("Enter Workshop ID")
+        self.renderer.invalidate()
         if mod_id:
             # Handle both raw ID and workshop- prefix
             if not mod_id.startswith("workshop-"):
@@ -306,39 +313,28 @@ class TUIApp:
         self._set_log_viewer(["--- Starting Update ---"], is_discord=False)
 
         def update_worker():
+            ui_state = self.state_manager.state.ui_state
+            log_content = ui_state.log_content
+            # The pane geometry is fixed for the duration of the run, so
+            # resolve the window and visible height once rather than per
+            # line of updater output
+            right_pane = self.renderer.window_manager.get_window("right_pane")
+            visible = right_pane.getmaxyx()[0] - 2 if right_pane else None
             try:
                 proc = self.manager_service.run_updater()
                 if proc.stdout:
                     for line in proc.stdout:
                         clean_line = line.strip()
-                        if clean_line:
-                            self.state_manager.state.ui_state.log_content.append(
-                                clean_line
-                            )
-                            # Auto-scroll to follow logs
-                            right_pane = self.renderer.window_manager.get_window(
-                                "right_pane"
-                            )
-                            if right_pane:
-                                lh, _ = right_pane.getmaxyx()
-                                if (
-                                    len(self.state_manager.state.ui_state.log_content)
-                                    > lh - 2
-                                ):
-                                    self.state_manager.state.ui_state.log_scroll_pos = (
-                                        len(
-                                            self.state_manager.state.ui_state.log_content
-                                        )
-                                        - (lh - 2)
-                                    )
+                        if not clean_line:
+                            continue
+                        log_content.append(clean_line)
+                        # Auto-scroll to follow logs
+                        if visible is not None and len(log_content) > visible:
+                            ui_state.log_scroll_pos = len(log_content) - visible
                 proc.wait()
-                self.state_manager.state.ui_state.log_content.append(
-                    "--- Update Complete ---"
-                )
+                log_content.append("--- Update Complete ---")
             except (OSError, subprocess.SubprocessError) as e:
-                self.state_manager.state.ui_state.log_content.append(
-                    f"Error during update: {e}"
-                )
+                log_content.append(f"Error during update: {e}")
 
         self.background_coordinator.run_in_background(update_worker)
 
@@ -359,8 +355,8 @@ class TUIApp:
         """Handle chat message event."""
         chat_logs = event.data
         if chat_logs and isinstance(chat_logs, list):
-            # The coordinator already handles deduplication and adds new messages
-            # to state.ui_state.cached_chat_logs, so we don't need to add them again here
+            # The coordinator already appends new messages to
+            # state.ui_state.cached_chat_logs, so we don't need to add them again here
             # Just request a redraw to show the updated chat logs
             pass
         self.state_manager.request_redraw()
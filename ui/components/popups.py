@@ -38,8 +38,8 @@ class PopupManager:
         input_win = popup.derwin(1, popup_w - 2, 1, 1)
         input_win.bkgd(" ", self.theme.pairs["highlight"])
 
-        # Make input blocking
-        self.stdscr.nodelay(0)
+        # Make input blocking for the duration of the popup
+        self.stdscr.timeout(-1)
         curses.curs_set(1)
         popup.refresh()
 
@@ -61,8 +61,10 @@ class PopupManager:
             return None
         finally:
             # Always restore settings
+            from ui.app import FRAME_TIMEOUT_MS  # noqa: C0415
+
             curses.curs_set(0)
-            self.stdscr.nodelay(1)
+            self.stdscr.timeout(FRAME_TIMEOUT_MS)
 
     def settings_popup(self) -> Optional[Tuple[str, str]]:
         """Create a settings popup for cluster and branch selection."""
@@ -93,7 +95,7 @@ class PopupManager:
         popup.bkgd(" ", self.theme.pairs["default"])
         popup.keypad(True)
 
-        self.stdscr.nodelay(0)
+        self.stdscr.timeout(-1)
 
         try:
             while True:
@@ -132,7 +134,9 @@ class PopupManager:
                         return (new_cluster, new_branch)
                     return None
         finally:
-            self.stdscr.nodelay(1)
+            from ui.app import FRAME_TIMEOUT_MS  # noqa: C0415
+
+            self.stdscr.timeout(FRAME_TIMEOUT_MS)
 
     def _draw_settings_popup(
         self, win, clusters, branches, cluster_idx, branch_idx
@@ -92,14 +92,18 @@ class WindowManager:
             win, self.box_chars, self.theme, title, use_border_attr=True
         )
 
-    def refresh_all(self) -> None:
-        """Refresh all windows."""
+    def refresh_all(self, do_update: bool = True) -> None:
+        """Refresh all windows.
+
+        With do_update=False only stages the windows, letting the caller
+        stage extra surfaces (pads) before a single curses.doupdate().
+        """
         try:
             self.stdscr.noutrefresh()
             for win in self.windows.values():
                 if win:
-                    win.touchwin()
                     win.noutrefresh()
-            curses.doupdate()
+            if do_update:
+                curses.doupdate()
         except curses.error:
             pass
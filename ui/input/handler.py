@@ -17,6 +17,12 @@ if TYPE_CHECKING:
 class InputHandler:
     """Input handler with settings support."""
 
+    # Keys safe to coalesce when held down; anything else has side effects
+    # that should render before the next key is processed
+    NAV_KEYS = frozenset(
+        {curses.KEY_UP, curses.KEY_DOWN, curses.KEY_LEFT, curses.KEY_RIGHT}
+    )
+
     def __init__(
         self, state_manager: StateManager, event_bus: EventBus, theme, popup_manager
     ):
@@ -59,33 +65,45 @@ class InputHandler:
         """
         Process all pending input.
         Returns True if exit requested, False otherwise.
+
+        Navigation key repeats are drained in one pass so holding an arrow
+        key collapses into a single redraw instead of one frame per event.
         """
         state = self.state_manager.state
-
-        while True:
-            key = stdscr.getch()
-            if key == -1:
-                break
-
-            self.state_manager.request_redraw()
-
-            # Handle special modes
-            if state.ui_state.log_viewer_active:
-                if self._handle_log_viewer_input(key):
-                    continue
-            elif state.ui_state.discord_logs_viewer_active:
-                if self._handle_discord_logs_viewer_input(key):
-                    continue
-            elif state.ui_state.mods_viewer_active:
-                if self._handle_mods_input(key):
-                    continue
-
-            # Handle normal input
-            handler = self.keymap.get(key)
-            if handler:
-                should_exit = handler(stdscr, key)
-                if should_exit:
-                    return True
+        draining = False
+
+        try:
+            key = stdscr.getch()  # Blocks up to the frame timeout
+            while key != -1:
+                self.state_manager.request_redraw()
+
+                handled = False
+                # Handle special modes
+                if state.ui_state.log_viewer_active:
+                    handled = self._handle_log_viewer_input(key)
+                elif state.ui_state.discord_logs_viewer_active:
+                    handled = self._handle_discord_logs_viewer_input(key)
+                elif state.ui_state.mods_viewer_active:
+                    handled = self._handle_mods_input(key)
+
+                if not handled:
+                    # Handle normal input
+                    handler = self.keymap.get(key)
+                    if handler and handler(stdscr, key):
+                        return True
+
+                # Only coalesce repeated navigation keys
+                if key not in self.NAV_KEYS:
+                    break
+                if not draining:
+                    stdscr.nodelay(1)
+                    draining = True
+                key = stdscr.getch()
+        finally:
+            if draining:
+                from ui.app import FRAME_TIMEOUT_MS  # noqa: C0415
+
+                stdscr.timeout(FRAME_TIMEOUT_MS)
 
         return False
 
@@ -185,6 +203,9 @@ class InputHandler:
     def _handle_settings(self, stdscr, key) -> bool:
         """Handle 's' key for settings."""
         result = self.popup_manager.settings_popup()
+        if self._app:
+            # The popup drew outside the diff path; force a repaint
+            self._app.renderer.invalidate()
         if result:
             # Settings were applied successfully
             pass
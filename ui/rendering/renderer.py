@@ -4,6 +4,9 @@
 """Main renderer for the TUI."""
 
 import curses
+import unicodedata
+from itertools import islice
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Optional
 
 from core.state.app_state import StateManager
@@ -31,9 +34,43 @@ PHASE_EMOJIS = {
 }
 
 
+def _display_width(text: str) -> int:
+    """On-screen column width of text under curses.
+
+    len() counts code points, but wide glyphs (emoji, CJK) occupy two
+    columns and combining marks occupy none, so padding arithmetic must
+    use this instead.
+    """
+    if text.isascii():
+        return len(text)
+    width = 0
+    for ch in text:
+        if ch == "\ufe0f":
+            # VS16 asks for emoji presentation, widening the preceding
+            # narrow glyph (❄️, ☀️) to two columns
+            width += 1
+            continue
+        if unicodedata.category(ch) in ("Mn", "Me", "Cf"):
+            continue
+        width += 2 if unicodedata.east_asian_width(ch) in "WF" else 1
+    return width
+
+
 class Renderer:
     """Main renderer for the TUI application."""
 
+    TITLE = "DST FISH MANAGER | F10: Toggle Discord Bot"
+    TITLE_WORKING = TITLE + " [WAITING...]"
+
+    FOOTERS = {
+        "mods": " ARROWS:NAV | ENTER:TOGGLE | A:ADD | M:BACK | Q:EXIT ",
+        "discord_logs": " ARROWS:SCROLL | R:REFRESH | D/Q:BACK ",
+        "default": (
+            " ARROWS:NAV | ENTER:TOGGLE | S:SETTINGS | M:MODS"
+            " | D:DISCORD | C:CHAT | Q:EXIT "
+        ),
+    }
+
     def __init__(self, stdscr, state_manager: StateManager):
         self.stdscr = stdscr
         self.state_manager = state_manager
@@ -49,38 +86,165 @@ class Renderer:
         # Store reference to app for settings access
         self._app: Optional["TUIApp"] = None
 
+        # Diff-rendering state: per-window map of (y, x) -> (text, attr) for
+        # the previously drawn frame, so unchanged cells are never re-emitted.
+        self._prev_cells: dict = {}
+        self._needs_full_redraw = True
+        self._right_pane_mode: Optional[str] = None
+        self._shard_row_count = -1
+
+        # Rendered chat lines keyed by (message, pane width) so truncation
+        # and formatting run once per message instead of once per frame
+        self._chat_line_cache: dict = {}
+
+        # Fully composed shard rows keyed by shard + selection state; rows
+        # are pure functions of a few booleans, so reassemble only on change
+        self._shard_row_cache: dict = {}
+
+        # Per-action styles resolved once against the theme; the draw loop
+        # indexes this instead of rebuilding a color map every frame
+        self._gl_styles = [
+            self.theme.pairs[theme_color] for _, theme_color in self.GL_ACTIONS
+        ]
+        # Marker+label strings prebuilt for both selection states, so the
+        # draw loop never allocates an f-string
+        self._gl_labels_sel = [f">{label}" for label, _ in self.GL_ACTIONS]
+        self._gl_labels_nosel = [f" {label}" for label, _ in self.GL_ACTIONS]
+
+        # Size-dependent positions and pre-padded strings; everything here
+        # only changes on resize, so it is rebuilt lazily after invalidate()
+        self._layout: Optional[SimpleNamespace] = None
+
+        # Log viewer pad: written once per content change, scrolled in C by
+        # prefresh instead of re-truncating every visible line per frame
+        self._log_pad = None
+        self._log_pad_version = None
+        self._log_pad_rows = 0
+
+    def invalidate(self) -> None:
+        """Drop the previous-frame cache and force a full erase + redraw.
+
+        Call after anything that drew outside the diff path (popups,
+        terminal resize) so stale cells don't survive on screen.
+        """
+        self._prev_cells.clear()
+        self._needs_full_redraw = True
+        self._right_pane_mode = None
+        self._shard_row_count = -1
+        self._layout = None
+        self._log_pad_version = None
+
+    def _put(self, win, y: int, x: int, text: str, attr: int = 0) -> None:
+        """Write text only if it differs from what was drawn last frame.
+
+        Pads with spaces when the new text is shorter than the previous
+        content at the same position, so no residue is left behind.
+        """
+        cells = self._prev_cells.setdefault(id(win), {})
+        prev = cells.get((y, x))
+        if prev is not None and prev[0] == text and prev[1] == attr:
+            return
+        # Pad by rendered columns, not code points: emoji cover two
+        # cells, so a len() delta would overwrite the new text's tail or
+        # leave residue from the old
+        width = _display_width(text)
+        try:
+            win.addstr(y, x, text, attr)
+            if prev is not None and prev[2] > width:
+                win.addstr(
+                    y,
+                    x + width,
+                    " " * (prev[2] - width),
+                    self.theme.pairs["default"],
+                )
+        except curses.error:
+            pass
+        cells[(y, x)] = (text, attr, width)
+
+    def _compute_layout(self) -> SimpleNamespace:
+        """Precompute size-dependent positions and pre-padded strings.
+
+        Every value here depends only on window geometry, so the draw
+        path can index it instead of redoing centering/fit arithmetic
+        per frame. Rebuilt lazily after invalidate() (resize, popups).
+        """
+        h, w = self.stdscr.getmaxyx()
+
+        # Header variants, already centered and clipped
+        headers = {}
+        for working, title in ((False, self.TITLE), (True, self.TITLE_WORKING)):
+            headers[working] = title.center(w)[: w - 1] if w > len(title) else None
+
+        # Footer variants, already padded to full width
+        footers = {}
+        for key, footer in self.FOOTERS.items():
+            footers[key] = (
+                (" " + footer).ljust(w)[: w - 1] if w > len(footer) + 2 else None
+            )
+
+        # Cluster-management cell positions with fit flags
+        gl_cells = []
+        gl_win = self.window_manager.get_window("global")
+        gh, gw = gl_win.getmaxyx() if gl_win else (0, 0)
+        for i, (label, _) in enumerate(self.GL_ACTIONS):
+            row = 1 + (i // 2)
+            col = 2 + (i % 2) * 19
+            fits = row < gh - 1 and col + len(label) + 2 < gw
+            gl_cells.append((row, col, fits))
+
+        return SimpleNamespace(
+            h=h, w=w, headers=headers, footers=footers, gl_cells=gl_cells
+        )
+
+    def _reset_window(self, win, title: str = "") -> None:
+        """Erase a window, drop its diff cache and redraw its box."""
+        win.erase()
+        self._prev_cells.pop(id(win), None)
+        self.window_manager.draw_box(win, title)
+
     def render(self) -> None:
         """Main render method."""
         # Check minimum terminal size
         h, w = self.stdscr.getmaxyx()
         if h < 12 or w < 40:
             self._render_too_small()
+            self.invalidate()
             return
 
-        # Set background for main screen
-        self.stdscr.bkgd(" ", self.theme.pairs["default"])
+        if self._needs_full_redraw:
+            # Full repaint: static borders are emitted here once and then
+            # only dynamic cells are diffed on subsequent frames.
+            self.stdscr.bkgd(" ", self.theme.pairs["default"])
+            self._clear_all_windows()
+            self._prev_cells.clear()
+            win = self.window_manager.get_window("status")
+            if win:
+                self.window_manager.draw_box(win, "WORLD STATUS")
+            win = self.window_manager.get_window("global")
+            if win:
+                self.window_manager.draw_box(win, "CLUSTER MANAGEMENT")
+            self._needs_full_redraw = False
 
-        # Clear all windows
-        self._clear_all_windows()
+        if self._layout is None:
+            self._layout = self._compute_layout()
 
         # Render components
-        self._render_header(w)
+        self._render_header()
         self._render_status()
         self._render_shards()
         self._render_global_controls()
         self._render_right_pane()
-        self._render_footer(h, w)
+        self._render_footer(h)
 
-        # Refresh all
-        self.window_manager.refresh_all()
-
-    def _draw_mods_box(self, win) -> None:
-        """Draw mods management box with proper borders."""
-        self.window_manager.draw_box(win, "MODS MANAGEMENT")
-
-    def _draw_logs_box(self, win, title: str) -> None:
-        """Draw logs box with proper borders."""
-        self.window_manager.draw_box(win, title)
+        # Refresh all; curses' own double buffer ships the minimal diff.
+        # The log pad must be staged after its backing window, so the
+        # doupdate is deferred until both are queued.
+        self.window_manager.refresh_all(do_update=False)
+        self._stage_log_pad()
+        try:
+            curses.doupdate()
+        except curses.error:
+            pass
 
     def _render_too_small(self) -> None:
         """Render message when terminal is too small."""
@@ -101,27 +265,14 @@ class Renderer:
             if win:
                 win.erase()
 
-    def _render_header(self, w: int) -> None:
+    def _render_header(self) -> None:
         """Render the header."""
         state = self.state_manager.state
-        title = "DST FISH MANAGER | F10: Toggle Discord Bot"
-        if state.is_working:
-            title += " [WAITING...]"
 
-        # Clear header line with background color
-        try:
-            self.stdscr.move(0, 0)
-            self.stdscr.clrtoeol()
-            self.stdscr.bkgd(" ", self.theme.pairs["default"])
-            self.stdscr.addstr(0, 0, " " * w, self.theme.pairs["default"])
-        except curses.error:
-            pass
-
-        start_x = (w - len(title)) // 2
-        if start_x > 0 and start_x + len(title) < w and w > len(title):
-            self.stdscr.addstr(
-                0, start_x, title, self.theme.pairs["title"] | curses.A_BOLD
-            )
+        # One full-width write so the diff clears a previously longer title
+        header = self._layout.headers[state.is_working]
+        if header is not None:
+            self._put(self.stdscr, 0, 0, header, self.theme.pairs["title_bold"])
 
     def _render_status(self) -> None:
         """Render server status window."""
@@ -129,8 +280,6 @@ class Renderer:
         if not win:
             return
 
-        self.window_manager.draw_box(win, "WORLD STATUS")
-
         h, w = win.getmaxyx()
         if h < 3 or w < 10:
             return
@@ -142,78 +291,55 @@ class Renderer:
         season_emojis = SEASON_EMOJIS
         phase_emojis = PHASE_EMOJIS
 
-        # Clear content area with proper width
-        for y in range(1, h - 1):
-            try:
-                win.addstr(y, 1, " " * (w - 2), self.theme.pairs["default"])
-            except curses.error:
-                pass
-
-        try:
-            season = status.season
-            phase = status.phase
-
-            s_emoji = season_emojis.get(season.lower(), "❓")
-            p_emoji = phase_emojis.get(phase.lower(), "❓")
-
-            # Line 1: Season: Emoji | Day: ...
-            season_info = f"{s_emoji}" if season != "---" else "Unknown"
-            day_info = status.day if status.day != "---" else "Unknown"
-            days_left_info = (
-                f"({status.days_left} left)" if status.days_left != "---" else ""
-            )
-
-            line1 = f"Season: {season_info} | Day: {day_info}"
-            if w > len(line1) + 4 and days_left_info:
-                line1 += f" {days_left_info}"
-
-            # Line 2: Phase: Emoji | Players: X
-            phase_info = f"{p_emoji}" if phase != "---" else "Unknown"
-            players_count = len(status.players) if status.players else 0
-            line2 = f"Phase: {phase_info} | Players: {players_count}"
-
-            win.addstr(1, 2, truncate_string(line1, w - 4), self.theme.pairs["default"])
-            if h >= 3:
-                win.addstr(
-                    2, 2, truncate_string(line2, w - 4), self.theme.pairs["default"]
-                )
-
-            # List players starting from line 3
-            if h > 4 and status.players:
-                max_players_to_show = h - 4
-                for i, p in enumerate(status.players):
-                    if i < max_players_to_show - 1 or (
-                        i == max_players_to_show - 1
-                        and len(status.players) == max_players_to_show
-                    ):
-                        # Handle case where 'char' field might not exist
-                        player_char = p.get("char", "Unknown")
-                        player_name = p.get("name", "Unknown")
-                        p_line = f"  {player_name} - {player_char}"
-                        try:
-                            win.addstr(
-                                3 + i,
-                                2,
-                                truncate_string(p_line, w - 4),
-                                self.theme.pairs["default"],
-                            )
-                        except curses.error:
-                            pass
-                    else:
-                        remaining = len(status.players) - i
-                        win.addstr(
-                            3 + i,
-                            2,
-                            f"  ... and {remaining} more",
-                            self.theme.pairs["default"],
-                        )
-                        break
-            elif h > 4:
-                # Show message when no players are online
-                win.addstr(3, 2, "  No players online", self.theme.pairs["default"])
+        season = status.season
+        phase = status.phase
+
+        s_emoji = season_emojis.get(season.lower(), "❓")
+        p_emoji = phase_emojis.get(phase.lower(), "❓")
+
+        # Line 1: Season: Emoji | Day: ...
+        season_info = f"{s_emoji}" if season != "---" else "Unknown"
+        day_info = status.day if status.day != "---" else "Unknown"
+        days_left_info = (
+            f"({status.days_left} left)" if status.days_left != "---" else ""
+        )
+
+        line1 = f"Season: {season_info} | Day: {day_info}"
+        if w > len(line1) + 4 and days_left_info:
+            line1 += f" {days_left_info}"
+
+        # Line 2: Phase: Emoji | Players: X
+        phase_info = f"{p_emoji}" if phase != "---" else "Unknown"
+        players_count = len(status.players) if status.players else 0
+        line2 = f"Phase: {phase_info} | Players: {players_count}"
+
+        rows = [line1, line2]
+
+        # List players starting from line 3
+        if h > 4 and status.players:
+            max_players_to_show = h - 4
+            for i, p in enumerate(status.players):
+                if i < max_players_to_show - 1 or (
+                    i == max_players_to_show - 1
+                    and len(status.players) == max_players_to_show
+                ):
+                    # Handle case where 'char' field might not exist
+                    player_char = p.get("char", "Unknown")
+                    player_name = p.get("name", "Unknown")
+                    rows.append(f"  {player_name} - {player_char}")
+                else:
+                    remaining = len(status.players) - i
+                    rows.append(f"  ... and {remaining} more")
+                    break
+        elif h > 4:
+            # Show message when no players are online
+            rows.append("  No players online")
 
-        except curses.error:
-            pass
+        # Write every content row; blank rows clear stale text via the diff
+        default = self.theme.pairs["default"]
+        for y in range(1, h - 1):
+            text = rows[y - 1] if y - 1 < len(rows) else ""
+            self._put(win, y, 2, truncate_string(text, w - 4), default)
 
     def _render_shards(self) -> None:
         """Render shards window."""
@@ -221,65 +347,93 @@ class Renderer:
         if not win:
             return
 
-        self.window_manager.draw_box(win, "SHARDS")
-
         state = self.state_manager.state
         shards = self.state_manager.get_shards_copy()
 
+        # Erase and redraw the box when the row count changes so removed
+        # rows don't linger (also draws the box on the first frame)
+        if len(shards) != self._shard_row_count:
+            self._reset_window(win, "SHARDS")
+            self._shard_row_count = len(shards)
+
         wh, ww = win.getmaxyx()
         if not shards:
             if ww > 20:
-                win.addstr(1, 2, "Loading shards...", self.theme.pairs["title"])
+                self._put(win, 1, 2, "Loading shards...", self.theme.pairs["title"])
             return
 
-        actions = ["🚀 Start", "🛑 Stop", "🔄 Restart", "📜 Logs"]
+        put = self._put
+        compose_row = self._compose_shard_row
+        ui_state = state.ui_state
         for i, shard in enumerate(shards):
-            try:
-                if i >= wh - 2:
-                    break
+            if i >= wh - 2:
+                break
 
-                marker = (
-                    ">"
-                    if (
-                        i == state.ui_state.selected_shard_idx
-                        and state.ui_state.selected_global_action_idx == -1
-                    )
-                    else " "
-                )
-                win.addstr(i + 1, 1, marker, self.theme.pairs["title"])
-
-                if ww < 14:
-                    continue
+            is_selected = (
+                i == ui_state.selected_shard_idx
+                and ui_state.selected_global_action_idx == -1
+            )
+            action_idx = ui_state.selected_action_idx if is_selected else -1
+            for col, text, attr in compose_row(shard, is_selected, action_idx, ww):
+                put(win, i + 1, col, text, attr)
+
+    SHARD_ACTIONS = ("🚀 Start", "🛑 Stop", "🔄 Restart", "📜 Logs")
+
+    def _compose_shard_row(
+        self, shard, is_selected: bool, action_idx: int, ww: int
+    ) -> list:
+        """Compose the (col, text, attr) segments for one shard row.
+
+        Cached by everything the row depends on, so marker/icon/button
+        strings are rebuilt only when a shard or the selection changes.
+        """
+        key = (shard.name, shard.is_running, is_selected, action_idx, ww)
+        segments = self._shard_row_cache.get(key)
+        if segments is not None:
+            return segments
+
+        marker = ">" if is_selected else " "
+        segments = [(1, marker, self.theme.pairs["title"])]
+
+        if ww >= 14:
+            display_name = truncate_string(shard.name, 10)
+            segments.append((2, display_name, self.theme.pairs["default"]))
+
+            # Status
+            status_color = (
+                self.theme.pairs["success"]
+                if shard.is_running
+                else self.theme.pairs["error"]
+            )
+            status_icon = "●" if shard.is_running else "○"
+            segments.append((13, status_icon, status_color))
 
-                display_name = truncate_string(shard.name, 10)
-                win.addstr(i + 1, 2, display_name)
+            # Buttons
+            for j, label in enumerate(self.SHARD_ACTIONS):
+                btn_col = 14 + j * 11
+                if btn_col + len(label) + 3 >= ww:
+                    break
 
-                # Status
-                status_color = (
-                    self.theme.pairs["success"]
-                    if shard.is_running
-                    else self.theme.pairs["error"]
+                style = (
+                    self.theme.pairs["highlight"]
+                    if j == action_idx
+                    else self.theme.pairs["default"]
                 )
-                status_icon = "●" if shard.is_running else "○"
-                win.addstr(i + 1, 13, status_icon, status_color)
-
-                # Buttons
-                for j, label in enumerate(actions):
-                    btn_col = 14 + j * 11
-                    if btn_col + len(label) + 3 >= ww:
-                        break
-
-                    style = self.theme.pairs["default"]
-                    if (
-                        i == state.ui_state.selected_shard_idx
-                        and j == state.ui_state.selected_action_idx
-                        and state.ui_state.selected_global_action_idx == -1
-                    ):
-                        style = self.theme.pairs["highlight"]
-
-                    win.addstr(i + 1, btn_col, f" {label} ", style)
-            except curses.error:
-                pass
+                segments.append((btn_col, f" {label} ", style))
+
+        if len(self._shard_row_cache) > 256:
+            self._shard_row_cache.clear()
+        self._shard_row_cache[key] = segments
+        return segments
+
+    GL_ACTIONS = (
+        ("Start", "success"),
+        ("Stop", "error"),
+        ("Enable", "success"),
+        ("Disable", "error"),
+        ("Restart", "warning"),
+        ("Update", "title"),
+    )
 
     def _render_global_controls(self) -> None:
         """Render cluster management window."""
@@ -287,44 +441,21 @@ class Renderer:
         if not win:
             return
 
-        self.window_manager.draw_box(win, "CLUSTER MANAGEMENT")
-
         state = self.state_manager.state
-        gl_actions = [
-            ("Start", 3),  # success green
-            ("Stop", 4),  # error red
-            ("Enable", 3),  # success green
-            ("Disable", 4),  # error red
-            ("Restart", 5),  # warning yellow
-            ("Update", 2),  # title cyan
-        ]
+        selected_idx = state.ui_state.selected_global_action_idx
+        highlight = self.theme.pairs["highlight"]
 
-        for i, (label, color_num) in enumerate(gl_actions):
-            try:
-                gh, gw = win.getmaxyx()
-                row = 1 + (i // 2)
-                col = 2 + (i % 2) * 19
-
-                if row >= gh - 1 or col + len(label) + 2 >= gw:
-                    continue
-
-                # Map color pair numbers to theme names
-                color_map = {
-                    2: "title",
-                    3: "success",
-                    4: "error",
-                    5: "warning",
-                    6: "border",
-                }
-                theme_color = color_map.get(color_num, "default")
-                style = self.theme.pairs[theme_color]
-                if i == state.ui_state.selected_global_action_idx:
-                    style = self.theme.pairs["highlight"]
-
-                marker = ">" if i == state.ui_state.selected_global_action_idx else " "
-                win.addstr(row, col, f"{marker}{label}", style)
-            except curses.error:
-                pass
+        for i, (row, col, fits) in enumerate(self._layout.gl_cells):
+            if not fits:
+                continue
+
+            if i == selected_idx:
+                style = highlight
+                text = self._gl_labels_sel[i]
+            else:
+                style = self._gl_styles[i]
+                text = self._gl_labels_nosel[i]
+            self._put(win, row, col, text, style)
 
     def _render_right_pane(self) -> None:
         """Render right pane (logs/mods/chat)."""
@@ -335,17 +466,33 @@ class Renderer:
         state = self.state_manager.state
 
         if state.ui_state.mods_viewer_active:
-            self._draw_mods_box(win)
-            self._render_mods(win)
+            mode = "mods"
         elif state.ui_state.discord_logs_viewer_active:
-            self._draw_logs_box(win, "DISCORD BOT LOGS [r: refresh]")
-            self._render_logs_pane(win)
+            mode = "discord_logs"
+        elif state.ui_state.log_viewer_active:
+            mode = "logs"
         else:
-            right_pane_title = (
-                "LOGS" if state.ui_state.log_viewer_active else "CHAT LOGS"
-            )
-            self._draw_logs_box(win, right_pane_title)
-            self._render_logs_pane(win)
+            mode = "chat"
+
+        if state.ui_state.mods_viewer_active:
+            # Mods viewer uses chgat-based highlighting; repaint it fully
+            self._reset_window(win, "MODS MANAGEMENT")
+            self._right_pane_mode = mode
+            self._render_mods(win)
+            return
+
+        # "chat_empty" is a sub-mode of "chat" managed by _render_logs_pane
+        current = self._right_pane_mode
+        if mode != current and not (mode == "chat" and current == "chat_empty"):
+            titles = {
+                "discord_logs": "DISCORD BOT LOGS [r: refresh]",
+                "logs": "LOGS",
+                "chat": "CHAT LOGS",
+            }
+            self._reset_window(win, titles[mode])
+            self._right_pane_mode = mode
+
+        self._render_logs_pane(win)
 
     def _render_mods(self, win) -> None:
         """Render mods list."""
@@ -389,44 +536,136 @@ class Renderer:
             or state.ui_state.discord_logs_viewer_active
         ):
             lh, lw_box = win.getmaxyx()
-            for i in range(1, lh - 1):
-                idx = state.ui_state.log_scroll_pos + i - 1
-                if idx < len(state.ui_state.log_content) and lw_box > 2:
-                    try:
-                        line = state.ui_state.log_content[idx]
-                        win.addstr(i, 1, truncate_string(line, lw_box - 2))
-                    except curses.error:
-                        pass
+            if lw_box <= 2:
+                return
+            # Rewrite the pad only when the content changes; scrolling is
+            # handled by prefresh in _stage_log_pad with no Python loop
+            log_content = state.ui_state.log_content
+            version = (id(log_content), len(log_content), lw_box)
+            if version != self._log_pad_version:
+                # Clean the window too, so shorter content doesn't leave
+                # rows from the previous log behind
+                title = (
+                    "DISCORD BOT LOGS [r: refresh]"
+                    if state.ui_state.discord_logs_viewer_active
+                    else "LOGS"
+                )
+                self._reset_window(win, title)
+                self._write_log_pad(log_content, lw_box - 2)
+                self._log_pad_version = version
         else:
             chat_logs = state.ui_state.cached_chat_logs
             lh, lw_box = win.getmaxyx()
             available_width = lw_box - 2
 
-            if chat_logs and len(chat_logs) > 1 and available_width > 0:
-                display_lines = (
-                    chat_logs[-(lh - 2) :] if len(chat_logs) >= (lh - 2) else chat_logs
-                )
-                for i, line in enumerate(display_lines):
-                    try:
-                        y = i + 1
-                        if line and len(line) > available_width:
-                            line = truncate_string(line, available_width - 3) + "..."
-
-                        # Use different colors for different message sources
-                        if line.startswith("[Discord]"):
-                            # Discord messages in blue
-                            win.addstr(y, 1, line, self.theme.pairs["discord"])
-                        elif line.startswith("[Game Chat]"):
-                            # Game messages in green
-                            win.addstr(y, 1, line, self.theme.pairs["game_chat"])
-                        else:
-                            # Regular messages in default color
-                            win.addstr(y, 1, line, self.theme.pairs["default"])
-                    except curses.error:
-                        pass
+            has_chat = bool(chat_logs) and len(chat_logs) > 1 and available_width > 0
+
+            # Switching between the ascii-art placeholder and real chat lines
+            # changes the cell layout entirely; repaint from a clean window
+            if has_chat != (self._right_pane_mode == "chat"):
+                self._reset_window(win, "CHAT LOGS")
+                self._right_pane_mode = "chat" if has_chat else "chat_empty"
+
+            if has_chat:
+                put = self._put
+                format_line = self._format_chat_line
+                # chat_logs is a deque; islice walks just the tail window
+                # that fits the pane instead of copying the history
+                n_cached = len(chat_logs)
+                needed = lh - 2
+                if n_cached > needed:
+                    display_lines = list(islice(chat_logs, n_cached - needed, n_cached))
+                else:
+                    display_lines = chat_logs
+                n_display = len(display_lines)
+                for i in range(lh - 2):
+                    line = display_lines[i] if i < n_display else ""
+                    text, attr = format_line(line, available_width)
+                    put(win, i + 1, 1, text, attr)
             else:
                 self._render_ascii_art(win)
 
+    def _write_log_pad(self, log_content: list, width: int) -> None:
+        """(Re)build the log pad with one addstr per content line."""
+        rows = max(len(log_content), 1)
+        try:
+            pad = curses.newpad(rows, max(width + 1, 2))
+        except curses.error:
+            self._log_pad = None
+            return
+        pad.bkgd(" ", self.theme.pairs["default"])
+        default = self.theme.pairs["default"]
+        addstr = pad.addstr
+        truncate = truncate_string
+        for i, line in enumerate(log_content):
+            try:
+                addstr(i, 0, truncate(line, width), default)
+            except curses.error:
+                pass
+        self._log_pad = pad
+        self._log_pad_rows = rows
+
+    def _stage_log_pad(self) -> None:
+        """Queue the visible slice of the log pad for the next doupdate."""
+        state = self.state_manager.state
+        if self._log_pad is None or not (
+            state.ui_state.log_viewer_active
+            or state.ui_state.discord_logs_viewer_active
+        ):
+            return
+
+        win = self.window_manager.get_window("right_pane")
+        if not win:
+            return
+        lh, lw_box = win.getmaxyx()
+        if lh <= 2 or lw_box <= 2:
+            return
+
+        by, bx = win.getbegyx()
+        scroll = min(state.ui_state.log_scroll_pos, self._log_pad_rows - 1)
+        # Clip the bottom edge when the remaining content is shorter than
+        # the pane; the erased window background covers the rest
+        max_row = min(by + lh - 2, by + self._log_pad_rows - scroll)
+        try:
+            self._log_pad.noutrefresh(
+                scroll, 0, by + 1, bx + 1, max_row, bx + lw_box - 2
+            )
+        except curses.error:
+            pass
+
+    def _format_chat_line(self, line: str, available_width: int) -> tuple:
+        """Return the truncated text and color attr for a chat line.
+
+        Results are cached per (line, width) since chat messages are
+        immutable and the pane width only changes on resize.
+        """
+        key = (line, available_width)
+        cached = self._chat_line_cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = line
+        if text and len(text) > available_width:
+            text = truncate_string(text, available_width - 3) + "..."
+
+        # Use different colors for different message sources
+        if text.startswith("[Discord]"):
+            # Discord messages in blue
+            attr = self.theme.pairs["discord"]
+        elif text.startswith("[Game Chat]"):
+            # Game messages in green
+            attr = self.theme.pairs["game_chat"]
+        else:
+            # Regular messages in default color
+            attr = self.theme.pairs["default"]
+
+        # Bound the cache; chat history itself is capped, so a full clear
+        # on overflow is cheaper than tracking per-entry age
+        if len(self._chat_line_cache) > 512:
+            self._chat_line_cache.clear()
+        self._chat_line_cache[key] = (text, attr)
+        return (text, attr)
+
     def _render_ascii_art(self, win) -> None:
         """Render ASCII art when no chat is available."""
         ascii_art = [
@@ -447,44 +686,30 @@ class Renderer:
         available_width = lw_box - 2
 
         if lh > len(ascii_art) + 2 and available_width > 50:
-            try:
-                start_y = (lh - len(ascii_art)) // 2
-                start_x = 1 + (available_width - 50) // 2
-                for i, line in enumerate(ascii_art):
-                    if start_y + i < lh - 1 and start_x + 50 < lw_box:
-                        win.addstr(
-                            start_y + i, start_x, line, self.theme.pairs["footer"]
-                        )
-            except curses.error:
-                pass
+            start_y = (lh - len(ascii_art)) // 2
+            start_x = 1 + (available_width - 50) // 2
+            for i, line in enumerate(ascii_art):
+                if start_y + i < lh - 1 and start_x + 50 < lw_box:
+                    self._put(win, start_y + i, start_x, line, self.theme.pairs["footer"])
         else:
             info_msg = "Game chat will appear here"
             if lh > 2 and lw_box > len(info_msg) + 2:
-                try:
-                    start_y = lh // 2
-                    start_x = 1 + (available_width - len(info_msg)) // 2
-                    win.addstr(start_y, start_x, info_msg, self.theme.pairs["footer"])
-                except curses.error:
-                    pass
-
-    def _render_footer(self, h: int, w: int) -> None:
+                start_y = lh // 2
+                start_x = 1 + (available_width - len(info_msg)) // 2
+                self._put(win, start_y, start_x, info_msg, self.theme.pairs["footer"])
+
+    def _render_footer(self, h: int) -> None:
         """Render the footer."""
         state = self.state_manager.state
 
         if state.ui_state.mods_viewer_active:
-            footer = " ARROWS:NAV | ENTER:TOGGLE | A:ADD | M:BACK | Q:EXIT "
+            key = "mods"
         elif state.ui_state.discord_logs_viewer_active:
-            footer = " ARROWS:SCROLL | R:REFRESH | D/Q:BACK "
+            key = "discord_logs"
         else:
-            footer = " ARROWS:NAV | ENTER:TOGGLE | S:SETTINGS | M:MODS | D:DISCORD | C:CHAT | Q:EXIT "
-
-        # Clear footer line with background color (only 1 line - h-1)
-        try:
-            self.stdscr.move(h - 1, 0)
-            self.stdscr.clrtoeol()
-            self.stdscr.addstr(h - 1, 0, " " * w, self.theme.pairs["footer"])
-        except curses.error:
-            pass
+            key = "default"
 
-        if h > 0 and w > len(footer) + 2:
-            self.stdscr.addstr(h - 1, 1, footer, self.theme.pairs["footer"])
+        # One full-width write; the diff skips it entirely when unchanged
+        footer = self._layout.footers[key]
+        if h > 0 and footer is not None:
+            self._put(self.stdscr, h - 1, 0, footer, self.theme.pairs["footer"])
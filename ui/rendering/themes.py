@@ -68,6 +68,8 @@ class Theme:
         self.pairs = {
             "default": curses.color_pair(1),
             "title": curses.color_pair(2),
+            # Title with bold pre-ORed in, saving the OR on every draw
+            "title_bold": curses.color_pair(2) | curses.A_BOLD,
             "success": curses.color_pair(3),
             "error": curses.color_pair(4),
             "warning": curses.color_pair(5),
@@ -95,6 +97,17 @@ class BoxChars:
             "mt": "┬",
             "mb": "┴",
         }
+        # Horizontal border strings cached per width; boxes come in a
+        # handful of sizes so this stays tiny
+        self._hline_by_width = {}
+
+    def hline(self, width: int) -> str:
+        """Return a horizontal border string of the given width."""
+        line = self._hline_by_width.get(width)
+        if line is None:
+            line = self.chars["h"] * width
+            self._hline_by_width[width] = line
+        return line
 
     @staticmethod
     def draw_box_with_title(
@@ -116,37 +129,37 @@ class BoxChars:
                 return
 
             chars = box_chars.chars
+            addstr = win.addstr  # Bound once for the per-row loop below
 
             if use_border_attr and theme:
                 win.attron(theme.pairs["border"])
 
             # Draw corners
-            win.addstr(0, 0, chars["tl"])
-            win.addstr(0, w - 1, chars["tr"])
-            win.addstr(h - 1, 0, chars["bl"])
+            addstr(0, 0, chars["tl"])
+            addstr(0, w - 1, chars["tr"])
+            addstr(h - 1, 0, chars["bl"])
             try:
-                win.addstr(h - 1, w - 1, chars["br"])
+                addstr(h - 1, w - 1, chars["br"])
             except curses.error:
                 try:
                     win.insstr(h - 1, w - 1, chars["br"])
                 except curses.error:
                     pass
 
-            # Draw lines
-            for x in range(1, w - 1):
-                win.addstr(0, x, chars["h"])
-                win.addstr(h - 1, x, chars["h"])
+            # Draw lines (one addstr per edge instead of one per cell)
+            hline = box_chars.hline(w - 2)
+            addstr(0, 1, hline)
+            addstr(h - 1, 1, hline)
+            v_char = chars["v"]
             for y in range(1, h - 1):
-                win.addstr(y, 0, chars["v"])
-                win.addstr(y, w - 1, chars["v"])
+                addstr(y, 0, v_char)
+                addstr(y, w - 1, v_char)
 
             if use_border_attr and theme:
                 win.attroff(theme.pairs["border"])
 
             # Draw title
             if title and w > len(title) + 4 and theme:
-                win.addstr(
-                    0, 2, f" {title} ", theme.pairs["title"] | curses.A_BOLD
-                )
+                win.addstr(0, 2, f" {title} ", theme.pairs["title_bold"])
         except curses.error:
             pass
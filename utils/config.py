@@ -15,6 +15,19 @@ HOME_DIR = Path.home()
 UNIT_PREFIX = "dontstarve@"
 UNIT_SUFFIX = ".service"
 
+# KEY="value" lines in the config file; compiled once at import
+_CONFIG_LINE_RE = re.compile(r'^\s*([^#\s=]+)\s*=\s*"?([^"]*)"?')
+
+# $VAR / ${VAR} references in config values; unknown variables are left
+# as-is, matching os.path.expandvars
+_VAR_RE = re.compile(r"\$\{?(\w+)\}?")
+
+
+@lru_cache(maxsize=64)
+def unit_name(shard_name: str) -> str:
+    """The full systemd unit name for a shard, built once per shard."""
+    return f"{UNIT_PREFIX}{shard_name}{UNIT_SUFFIX}"
+
 
 def _find_config_file():
     paths = [
@@ -40,21 +53,46 @@ class ConfigManager:
     def __init__(self):
         self._config_cache = {}
         self._config_file_path = None
+        self._cache_mtime = None
+
+    def read_config_cached(self) -> Dict[str, str]:
+        """Read configuration, reusing the parsed dict while the file is unchanged.
+
+        A single stat replaces the read+parse when the config file's mtime
+        matches the last read. Callers that tolerate a same-second stale
+        read (periodic refreshes, info lookups) should prefer this.
+        """
+        if GAME_CONFIG_FILE:
+            try:
+                mtime = os.stat(GAME_CONFIG_FILE).st_mtime
+            except OSError:
+                mtime = None
+            if mtime is not None and mtime == self._cache_mtime:
+                return self._config_cache
+            config = self.read_config()
+            self._cache_mtime = mtime
+            return config
+        return self.read_config()
 
     def read_config(self) -> Dict[str, str]:
         """Read configuration from file."""
         config = {}
         if GAME_CONFIG_FILE and GAME_CONFIG_FILE.is_file():
             self._config_file_path = GAME_CONFIG_FILE
+            # One environment snapshot serves every value in the file
+            env = os.environ
+            expand = _VAR_RE.sub
             with GAME_CONFIG_FILE.open("r") as f:
                 for line in f:
                     line = line.strip()
                     if not line or line.startswith("#"):
                         continue
-                    match = re.match(r'^\s*([^#\s=]+)\s*=\s*"?([^"]*)"?', line)
+                    match = _CONFIG_LINE_RE.match(line)
                     if match:
                         key, value = match.groups()
-                        config[key] = os.path.expandvars(value)
+                        config[key] = expand(
+                            lambda m: env.get(m.group(1), m.group(0)), value
+                        )
         else:
             # Create default config
             self._config_file_path = GAME_CONFIG_FILE or (
@@ -101,6 +139,7 @@ class ConfigManager:
                 f.write("# Master\n# Caves\n# Islands\n# Volcano\n")
 
             self._config_cache = config
+            self._cache_mtime = None  # Force a re-read after our own write
             return True
         except (OSError, PermissionError) as e:
             print(f"Error writing config: {e}", file=sys.stderr)  # noqa: T201
@@ -206,7 +245,7 @@ class Shard:
     @property
     def unit_name(self) -> str:
         """The full systemd unit name."""
-        return f"{UNIT_PREFIX}{self.name}{UNIT_SUFFIX}"
+        return unit_name(self.name)
 
     def __repr__(self) -> str:
         return (
@@ -252,14 +291,31 @@ def get_game_config() -> Dict[str, Any]:
     }
 
 
+# shards.conf parse cache: (mtime, shard names). Edits land through a
+# rewrite, so an mtime match means the parsed list is still valid and a
+# poll costs one stat instead of a read+parse
+_shards_cache: tuple = (None, [])
+
+
 def read_desired_shards() -> List[str]:
     """Reads shard names from the shards.conf file."""
-    if not SHARDS_FILE.is_file():
+    global _shards_cache  # noqa: W0603
+
+    try:
+        mtime = os.stat(SHARDS_FILE).st_mtime
+    except OSError:
         return []
+
+    cached_mtime, cached_shards = _shards_cache
+    if mtime == cached_mtime:
+        return cached_shards
+
     with SHARDS_FILE.open("r") as f:
         lines = f.readlines()
-    return [
+    shards = [
         line.strip()
         for line in lines
         if line.strip() and not line.strip().startswith("#")
     ]
+    _shards_cache = (mtime, shards)
+    return shards
@@ -3,6 +3,43 @@
 
 """Common utility functions."""
 
+import os
+
+
+def read_tail_lines(path, lines: int) -> list:
+    """Read the last `lines` lines of a text file without scanning it all.
+
+    Seeks near the end and widens the window (doubling) until enough
+    newlines are in view or the start of the file is reached, so the
+    cost tracks the tail size rather than the file size.
+    """
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return []
+
+    window = max(1024, lines * 256)
+    with open(path, "rb") as f:
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            data = f.read()
+            if start == 0 or data.count(b"\n") > lines:
+                break
+            window *= 2
+
+    chunks = data.split(b"\n")
+    if start > 0:
+        # The window almost never lands on a line boundary; the first
+        # chunk is a partial line, so drop it
+        chunks = chunks[1:]
+    decoded = [
+        chunk.decode("utf-8", errors="replace")
+        for chunk in chunks
+        if chunk.strip()
+    ]
+    return decoded[-lines:]
+
 
 def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     """Truncate string to max_length with suffix."""
@@ -5,10 +5,14 @@
 
 import logging
 import logging.handlers
+import queue
 from collections import deque
+from itertools import islice
 from pathlib import Path
 from typing import Optional, List
 
+from utils.helpers import read_tail_lines
+
 
 class InMemoryLogHandler(logging.Handler):
     """Custom log handler that stores logs in memory for TUI display."""
@@ -26,6 +30,10 @@ class InMemoryLogHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord):
         """Emit a log record."""
+        # Skip the format() work (which %-expands the message args) for
+        # records this handler's level would drop anyway
+        if record.levelno < self.level:
+            return
         try:
             msg = self.format(record)
             # Don't use a lock here - Handler.emit() is already called within acquire/release
@@ -46,9 +54,13 @@ class InMemoryLogHandler(logging.Handler):
         # Use the handler's lock for thread safety
         self.acquire()
         try:
-            if lines is None:
+            if lines is None or lines >= len(self.logs):
                 return list(self.logs)
-            return list(self.logs)[-lines:]
+            # Take the tail from the right end so the cost tracks the
+            # requested count, not the deque's full length
+            tail = list(islice(reversed(self.logs), lines))
+            tail.reverse()
+            return tail
         finally:
             self.release()
 
@@ -82,10 +94,11 @@ class DiscordBotLogger:
         self.memory_handler = InMemoryLogHandler(maxlen=1000)
         self.memory_handler.setLevel(logging.INFO)
         self.memory_handler.setFormatter(formatter)
-        self.logger.addHandler(self.memory_handler)
 
         # Create file handler for persistent logging
         self.log_file_path = None
+        sink_handlers = [self.memory_handler]
+        file_error = None
         try:
             # Create logs directory if it doesn't exist
             log_dir = Path.home() / ".local" / "share" / "dst-fish-manager" / "logs"
@@ -101,12 +114,27 @@ class DiscordBotLogger:
             )
             file_handler.setLevel(logging.INFO)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            sink_handlers.append(file_handler)
 
             self.log_file_path = str(log_file)
         except (OSError, IOError) as e:  # noqa: BLE001
-            # If file logging fails, just continue with memory logging
-            self.logger.warning("Failed to setup file logging: %s", e)
+            # If file logging fails, just continue with memory logging;
+            # logged below once a handler exists, so the record doesn't
+            # fall through to lastResort's stderr write
+            file_error = e
+
+        # Route records through a queue so emitting is just an enqueue;
+        # the listener thread pays the formatting and (rotating) file
+        # write instead of whoever happened to log
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *sink_handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+        if file_error is not None:
+            self.logger.warning("Failed to setup file logging: %s", file_error)
 
     def get_logger(self) -> logging.Logger:
         """Get the Discord bot logger instance."""
@@ -145,9 +173,9 @@ class DiscordBotLogger:
             return []
 
         try:
-            with open(log_file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                return [line.rstrip("\n") for line in lines[-max_lines:]]
+            # Seek-based tail: the rotating log can be 10 MB, reading it
+            # all to show the last few hundred lines is wasted I/O
+            return read_tail_lines(log_file_path, max_lines)
         except (OSError, IOError) as e:
             return [f"Error reading log file: {e}"]
         except Exception as e:  # noqa: BLE001
@@ -187,6 +215,10 @@ class DiscordBotLogger:
         if self.memory_handler:
             self.memory_handler.clear()
 
+    def close(self):
+        """Stop the queue listener, flushing queued records first."""
+        self._listener.stop()
+
     # Convenience methods
     def info(self, message: str):
         """Log info message."""
@@ -205,5 +237,16 @@ class DiscordBotLogger:
         self.logger.debug(message)
 
 
-# Global instance
-discord_logger = DiscordBotLogger()
+# Global instance, created on first use (PEP 562): importing this module
+# for InMemoryLogHandler alone no longer pays the log-directory mkdir,
+# file open and listener-thread start
+_discord_logger_instance: Optional[DiscordBotLogger] = None
+
+
+def __getattr__(name: str):
+    global _discord_logger_instance  # noqa: W0603
+    if name == "discord_logger":
+        if _discord_logger_instance is None:
+            _discord_logger_instance = DiscordBotLogger()
+        return _discord_logger_instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")